@@ -0,0 +1,5 @@
+import sys
+
+from byte_pusher_py.byte_pusher_cli import main
+
+sys.exit(main())
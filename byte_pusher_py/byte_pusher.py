@@ -1,60 +1,142 @@
+import sys
+import logging
 import pygame
 
-from byte_pusher_py.byte_pusher_iodriver import BytePusherIODriver
+from byte_pusher_py.byte_pusher_audio import SAMPLE_RATE, PygameAudioSink
+from byte_pusher_py.byte_pusher_export import ExportDriver, FrameExporter, create_writer
+from byte_pusher_py.byte_pusher_input import CombinedInput, GamepadInput, KeyboardInput
+from byte_pusher_py.byte_pusher_iodriver import BytePusherIndexedIODriver, BytePusherIODriver
+from byte_pusher_py.byte_pusher_perf import FrameProfiler, PerfOverlay, TextOverlay
+from byte_pusher_py.byte_pusher_pipeline import FramePacer, PipelinedRunner
+from byte_pusher_py.byte_pusher_replay import InputRecorder
 from byte_pusher_py.byte_pusher_vm import BytePusherVM
 
 class BytePusher:
-    def __init__(self):
+    def __init__(self, engine: str = 'auto', audio: bool = True, record: str | None = None,
+                 profiler: FrameProfiler | None = None, pipelined: bool = False, scale: int = 1,
+                 indexed: bool = True, keymap: dict | None = None, gamepad: int | None = None,
+                 export: str | None = None):
+        if pipelined and profiler is not None:
+            # As marcações do FrameProfiler supõem um único thread
+            raise ValueError("A instrumentação por quadro não é suportada no modo em pipeline")
+        if pipelined and export is not None:
+            # No modo em pipeline os quadros atrasados são descartados antes da apresentação
+            raise ValueError("A exportação de quadros não é suportada no modo em pipeline")
+
+        # Mixer em 8 bits com sinal e mono, na taxa nativa de 256 amostras por quadro;
+        # sem mudanças permitidas, o SDL converte para a taxa do dispositivo
+        pygame.mixer.pre_init(SAMPLE_RATE, -8, 1, 512, allowedchanges=0)
         pygame.init()
         
-        # Define a resolução da tela (256x256 pixels, por exemplo)
-        self.screen = pygame.display.set_mode((256, 256))
+        # Define a resolução da tela (256x256 pixels multiplicados pela escala)
+        self.screen = pygame.display.set_mode((256 * scale, 256 * scale))
 
         pygame.display.set_caption("BytePusherPython")
         self.running = True
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont('Arial', 18)
         
-        self.iodriver = BytePusherIODriver(self.screen)
-        self.vm = BytePusherVM(self.iodriver)
+        audio_sink = self.create_audio_sink() if audio else None
+        # Palavra de teclas atualizada pelos eventos tratados em handle_events
+        self.input = KeyboardInput(keymap)
+        if gamepad is not None:
+            self.input = CombinedInput([self.input, GamepadInput(gamepad)])
+        if indexed or scale != 1:
+            # Superfície de 8 bits com paleta, ampliada por pygame.transform.scale
+            self.iodriver = BytePusherIndexedIODriver(self.screen, scale, audio_sink, self.input)
+        else:
+            # Conversão RGB com atualização apenas das regiões alteradas
+            self.iodriver = BytePusherIODriver(self.screen, audio_sink, input_backend=self.input)
+        self.vm = BytePusherVM(self.iodriver, engine=engine)
+        if record is not None:
+            # Grava as teclas de cada quadro para reprodução determinística
+            self.vm.iodriver = InputRecorder(self.iodriver, record)
+        if export is not None:
+            # Conversão e codificação em lotes, sem guardar a gravação inteira na memória
+            self.vm.iodriver = ExportDriver(self.vm.iodriver, FrameExporter(create_writer(export)))
+
+        # Com instrumentação, a camada de FPS passa a mostrar p50/p99 de cada etapa
+        self.profiler = profiler
+        self.vm.profiler = profiler
+        self.iodriver.profiler = profiler
+        self.fps_overlay = PerfOverlay(self.font, profiler) if profiler is not None else TextOverlay(self.font)
+        self.iodriver.overlays = [self.fps_overlay]
+
+        # Emulação em um thread próprio, cadenciada a 60 Hz; este thread só apresenta
+        self.pipeline = PipelinedRunner(self.vm, pacer=FramePacer(60)) if pipelined else None
+
+    def create_audio_sink(self):
+        try:
+            return PygameAudioSink()
+        except pygame.error as error:
+            # Sem dispositivo de áudio: segue sem som
+            logging.warning(f"Áudio desativado: {error}")
+            return None
 
     def load_rom(self, rom: str):
         self.vm.load(rom)  # Carrega o ROM na VM
 
     def update(self):
         # Loop principal do Pygame
+        if self.pipeline is not None:
+            self.update_pipelined()
+            return
+
+        profiler = self.profiler
         while self.running:
+            if profiler is not None:
+                profiler.begin()
             self.handle_events()
+            if profiler is not None:
+                profiler.mark('handle_events')
             
             self.vm.run()
+            if profiler is not None:
+                profiler.end()
 
-            # Calcula os FPS
+            # Calcula os FPS; o texto aparece junto do próximo quadro
             fps = self.clock.get_fps()
-            
-            # Exibe FPS, CPU e GPU na tela
             self.display_fps(fps)
 
             # Limita o FPS para 60 quadros por segundo
             self.clock.tick(60)
 
+    def update_pipelined(self):
+        self.pipeline.start()
+        try:
+            while self.running:
+                self.handle_events()
+                if self.pipeline.present_latest():
+                    # Sem limite aqui: o ritmo vem do FramePacer da emulação
+                    self.clock.tick()
+                    self.display_fps(self.clock.get_fps())
+        finally:
+            self.pipeline.stop()
+
     def handle_events(self):
+        handle_event = self.input.handle_event
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            else:
+                handle_event(event)
                 
     def draw(self):
         pass
     
     def display_fps(self, fps):
-        fps_text = self.font.render(f'FPS: {fps:.2f}', True, (255, 255, 255))
-        self.screen.blit(fps_text, (10, 10))
-        pygame.display.update()
+        if self.profiler is not None:
+            self.fps_overlay.update(fps)
+        else:
+            # Superfície em cache: só é renderizada de novo quando o valor muda
+            self.fps_overlay.set_lines([f'FPS: {fps:.0f}'])
 
     def cleanup(self):
+        self.vm.iodriver.close()
         pygame.quit()
 
 if __name__ == "__main__":
     byte_pusher = BytePusher()
-    byte_pusher.load_rom(r"C:\Users\mseid\Downloads\nyan.bp")
+    byte_pusher.load_rom(sys.argv[1])
     byte_pusher.update()
     byte_pusher.cleanup()
@@ -0,0 +1,110 @@
+import wave
+import numpy as np
+
+SAMPLES_PER_FRAME = 256
+SAMPLE_RATE = SAMPLES_PER_FRAME * 60  # 15360 Hz
+
+class AudioRingBuffer:
+    def __init__(self, capacity: int = SAMPLES_PER_FRAME * 8):
+        # Fila circular (FIFO) de tamanho fixo, sem alocações por quadro. Escrita e
+        # leitura acontecem na mesma thread (write seguido de pump no PygameAudioSink).
+        # Os índices crescem sem limite e são reduzidos pelo módulo da capacidade
+        # apenas no acesso ao buffer.
+        self.buffer = np.zeros(capacity, dtype=np.int8)
+        self.capacity = capacity
+        self.write_index = 0
+        self.read_index = 0
+        self.overruns = 0
+        self.underruns = 0
+
+    def available(self) -> int:
+        return self.write_index - self.read_index
+
+    def write(self, samples) -> bool:
+        length = len(samples)
+        if self.capacity - self.available() < length:
+            # Consumidor atrasado: descarta o quadro em vez de bloquear a emulação
+            self.overruns += 1
+            return False
+        position = self.write_index % self.capacity
+        first = min(length, self.capacity - position)
+        self.buffer[position:position + first] = samples[:first]
+        self.buffer[:length - first] = samples[first:]
+        self.write_index += length
+        return True
+
+    def read(self, out: np.ndarray) -> int:
+        length = min(len(out), self.available())
+        position = self.read_index % self.capacity
+        first = min(length, self.capacity - position)
+        out[:first] = self.buffer[position:position + first]
+        out[first:length] = self.buffer[:length - first]
+        if length < len(out):
+            # Dados insuficientes: completa com silêncio
+            self.underruns += 1
+            out[length:] = 0
+        self.read_index += length
+        return length
+
+class PygameAudioSink:
+    def __init__(self, chunk: int = SAMPLES_PER_FRAME * 2, capacity: int = SAMPLES_PER_FRAME * 8):
+        import pygame
+
+        self.pygame = pygame
+        if not pygame.mixer.get_init():
+            # Sem mudanças permitidas: o SDL converte taxa, formato e canais para o dispositivo
+            pygame.mixer.init(frequency=SAMPLE_RATE, size=-8, channels=1, buffer=chunk, allowedchanges=0)
+        # Um mixer já aberto por outro código pode ter taxa e formato diferentes do pedido
+        self.frequency, self.size, self.channels = pygame.mixer.get_init()
+        # Índices de reamostragem (vizinho mais próximo) de um bloco na taxa do mixer
+        self.resample = None
+        if self.frequency != SAMPLE_RATE:
+            self.resample = np.arange(chunk * self.frequency // SAMPLE_RATE) * SAMPLE_RATE // self.frequency
+        self.ring = AudioRingBuffer(capacity)
+        self.chunk = np.zeros(chunk, dtype=np.int8)
+        self.channel = pygame.mixer.Channel(0)
+
+    def write(self, samples):
+        self.ring.write(samples)
+        self.pump()
+
+    def pump(self):
+        # Não bloqueante: só enfileira um novo bloco quando a fila do canal está livre
+        if self.channel.get_queue() is not None:
+            return
+        self.ring.read(self.chunk)
+        sound = self.pygame.mixer.Sound(buffer=self.convert(self.chunk).tobytes())
+        if self.channel.get_busy():
+            self.channel.queue(sound)
+        else:
+            self.channel.play(sound)
+
+    def convert(self, samples: np.ndarray) -> np.ndarray:
+        if self.resample is not None:
+            samples = samples[self.resample]
+        if self.size == 8:
+            samples = samples.view(np.uint8) ^ 0x80
+        elif abs(self.size) == 16:
+            samples = samples.astype(np.int16) << 8
+        elif abs(self.size) == 32:
+            samples = samples.astype(np.float32) / 128
+        if self.channels > 1:
+            samples = np.repeat(samples, self.channels)
+        return samples
+
+    def close(self):
+        self.channel.stop()
+
+class WavAudioSink:
+    def __init__(self, path: str):
+        self.wav = wave.open(path, 'wb')
+        self.wav.setnchannels(1)
+        self.wav.setsampwidth(1)
+        self.wav.setframerate(SAMPLE_RATE)
+
+    def write(self, samples):
+        # WAV de 8 bits é sem sinal: desloca as amostras em 128
+        self.wav.writeframesraw((samples.view(np.uint8) ^ 0x80).tobytes())
+
+    def close(self):
+        self.wav.close()
@@ -0,0 +1,162 @@
+import os
+import sys
+import json
+import time
+import random
+import platform
+import tempfile
+import subprocess
+
+from byte_pusher_py.byte_pusher_export import FrameExporter, create_writer
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver
+from byte_pusher_py.byte_pusher_native import native_available
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+
+CODE_START = 0x010000
+DATA_START = 0x020000
+SCRATCH_START = 0x030000
+DISPLAY_PAGE = 0x08      # Página de vídeo em 0x080000
+AUDIO_BANK = 0x0900      # Banco de som em 0x090000
+INSTRUCTION_COUNT = 4096
+
+# Módulos cuja importação é medida; nenhum deles pode carregar pygame ou Numba
+IMPORT_MODULES = ('byte_pusher_vm', 'byte_pusher_headless', 'byte_pusher_cli')
+HEAVY_MODULES = ('pygame', 'numba')
+
+WORKLOADS = ('straight', 'branching', 'self_modifying', 'display')
+
+def bench_engines() -> tuple[str, ...]:
+    # O motor nativo só entra quando o Numba realmente importa (carregado aqui, não no import do módulo)
+    return ('python', 'jit') + (('native',) if native_available() else ())
+
+def encode_instruction(source: int, target: int, jump: int) -> bytes:
+    return source.to_bytes(3, 'big') + target.to_bytes(3, 'big') + jump.to_bytes(3, 'big')
+
+def generate_rom(workload: str, seed: int = 0, count: int = INSTRUCTION_COUNT) -> bytes:
+    if workload not in WORKLOADS:
+        raise ValueError(f"Carga desconhecida: {workload!r} (disponíveis: {', '.join(WORKLOADS)})")
+    rng = random.Random(seed)
+    rom = bytearray(SCRATCH_START)
+    rom[2:5] = CODE_START.to_bytes(3, 'big')
+    rom[5] = DISPLAY_PAGE
+    rom[6:8] = AUDIO_BANK.to_bytes(2, 'big')
+    rom[DATA_START:SCRATCH_START] = bytes(rng.randrange(256) for _ in range(SCRATCH_START - DATA_START))
+
+    def address(i):
+        return CODE_START + 9 * (i % count)
+
+    for i in range(count):
+        source = DATA_START + rng.randrange(SCRATCH_START - DATA_START)
+        target = SCRATCH_START + rng.randrange(0x10000)
+        jump = address(i + 1)
+        if workload == 'branching':
+            # Cada instrução salta para outra qualquer: nenhum bloco linear
+            jump = address(rng.randrange(count))
+        elif workload == 'self_modifying':
+            # Reescreve o byte baixo da origem da próxima instrução
+            target = address(i + 1) + 2
+        elif workload == 'display':
+            target = (DISPLAY_PAGE << 16) + rng.randrange(0x10000)
+        rom[address(i):address(i) + 9] = encode_instruction(source, target, jump)
+    return bytes(rom)
+
+def time_frames(function, frames: int) -> float:
+    # Um quadro de aquecimento (compilação do JIT, caches) antes da medição
+    function()
+    start = time.perf_counter()
+    for _ in range(frames):
+        function()
+    return (time.perf_counter() - start) / frames
+
+def bench_process_byte_byte_jump(workload: str, engine: str, frames: int) -> float:
+    vm = BytePusherVM(BytePusherHeadlessDriver(), engine=engine)
+    vm.load_image(generate_rom(workload))
+    return time_frames(vm.process_byte_byte_jump, frames)
+
+def bench_render_display_frame(frames: int, driver: str = 'rgb', scale: int = 1) -> float:
+    # Renderiza em uma janela invisível para medir também o blit e o flip
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    from byte_pusher_py.byte_pusher_iodriver import BytePusherIndexedIODriver, BytePusherIODriver
+
+    pygame.display.init()
+    try:
+        screen = pygame.display.set_mode((256 * scale, 256 * scale))
+        if driver == 'indexed':
+            iodriver = BytePusherIndexedIODriver(screen, scale)
+        else:
+            # Sem regiões alteradas: mede o pior caso, com a tela inteira mudando
+            iodriver = BytePusherIODriver(screen, dirty_regions=False)
+        page = generate_rom('display')[DATA_START:DATA_START + 0x10000]
+        return time_frames(lambda: iodriver.render_display_frame(page), frames)
+    finally:
+        pygame.display.quit()
+
+def bench_load(frames: int, size: int = 4 << 20) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.bp')
+        with open(path, 'wb') as fs:
+            fs.write(generate_rom('straight').ljust(size, b'\x00'))
+        vm = BytePusherVM(BytePusherHeadlessDriver())
+        return time_frames(lambda: vm.load(path), frames)
+
+def bench_export(frames: int, extension: str) -> float:
+    # Tempo por quadro da conversão em lotes e codificação; abaixo de 16,7 ms é mais rápido que o tempo real
+    pages = generate_rom('straight')[DATA_START:SCRATCH_START]
+    with tempfile.TemporaryDirectory() as directory:
+        exporter = FrameExporter(create_writer(os.path.join(directory, f'bench{extension}')))
+        seconds = time_frames(lambda: exporter.add_frame(pages), frames)
+        exporter.close()
+    return seconds
+
+def measure_import(module: str) -> tuple[float, list[str]]:
+    # Interpretador novo a cada medição: nada fica em cache no sys.modules
+    code = (f"import sys, time\n"
+            f"start = time.perf_counter()\n"
+            f"import byte_pusher_py.{module}\n"
+            f"print(time.perf_counter() - start)\n"
+            f"print(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))")
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.split('\n')
+    return float(output[0]), output[1].split()
+
+def bench_import(module: str, runs: int = 5) -> float:
+    return min(measure_import(module)[0] for _ in range(runs))
+
+def run_benchmarks(frames: int = 5) -> dict:
+    results = {}
+    for workload in WORKLOADS:
+        for engine in bench_engines():
+            results[f"process_byte_byte_jump/{workload}/{engine}"] = bench_process_byte_byte_jump(workload, engine, frames)
+    results["render_display_frame/rgb"] = bench_render_display_frame(frames * 10)
+    results["render_display_frame/indexed"] = bench_render_display_frame(frames * 10, 'indexed')
+    results["render_display_frame/indexed_x4"] = bench_render_display_frame(frames * 10, 'indexed', 4)
+    results["load/4MiB"] = bench_load(frames)
+    results["export/gif"] = bench_export(frames * 10, '.gif')
+    results["export/apng"] = bench_export(frames * 10, '.png')
+    for module in IMPORT_MODULES:
+        results[f"import/{module}"] = bench_import(module)
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'frames': frames,
+        # Segundos por chamada; menor é melhor
+        'results': results,
+    }
+
+def compare_results(results: dict, baseline: dict, threshold: float = 0.10) -> list[str]:
+    # Regressão: tempo acima da referência em mais que o limite relativo
+    regressions = []
+    for name, seconds in results['results'].items():
+        reference = baseline['results'].get(name)
+        if reference and seconds > reference * (1 + threshold):
+            regressions.append(f"{name}: {seconds * 1000:.3f} ms (referência {reference * 1000:.3f} ms, +{(seconds / reference - 1) * 100:.1f}%)")
+    return regressions
+
+def load_results(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as fs:
+        return json.load(fs)
+
+def save_results(results: dict, path: str):
+    with open(path, 'w', encoding='utf-8') as fs:
+        json.dump(results, fs, indent=2)
@@ -0,0 +1,227 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+from byte_pusher_py.byte_pusher_audio import WavAudioSink
+from byte_pusher_py.byte_pusher_bench import compare_results, load_results, run_benchmarks, save_results
+from byte_pusher_py.byte_pusher_export import ExportDriver, FrameExporter, create_writer
+from byte_pusher_py.byte_pusher_farm import load_manifest, run_farm
+from byte_pusher_py.byte_pusher_perf import FrameProfiler
+from byte_pusher_py.byte_pusher_input import load_keymap
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, load_key_script, run_headless
+from byte_pusher_py.byte_pusher_tiled import TiledRunner, run_tiled_viewer, write_rgb_ppm
+from byte_pusher_py.byte_pusher_trace import ExecutionTracer
+from byte_pusher_py.byte_pusher_replay import InputRecorder, ReplayDriver, verify_hash_logs
+from byte_pusher_py.byte_pusher_vm import ENGINES, BytePusherVM
+from byte_pusher_py.log_config import configure_logging
+
+def add_engine_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--engine', choices=ENGINES, default='auto',
+                        help="Motor do ByteByteJump (auto: nativo com Numba, senão Python)")
+    parser.add_argument('--jit', dest='engine', action='store_const', const='jit', help='Atalho para --engine jit')
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='byte-pusher', description='Emulador BytePusher')
+    parser.add_argument('--log-dir', help='Grava o log da execução neste diretório (desligado por padrão)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Executa uma ROM sem janela, o mais rápido possível')
+    run_parser.add_argument('rom', help='Caminho da ROM')
+    run_parser.add_argument('-n', '--frames', type=int, default=60, help='Número de quadros a executar')
+    run_parser.add_argument('-k', '--keys', help='Script de teclas: linhas "<quadro> <palavra de teclas>"')
+    run_parser.add_argument('-o', '--output-dir', help='Diretório para gravar os quadros em PPM')
+    run_parser.add_argument('--dump-every', type=int, default=1, help='Grava um quadro a cada N')
+    run_parser.add_argument('--wav', help='Grava o áudio em um arquivo WAV')
+    run_parser.add_argument('--record', help='Grava as teclas de cada quadro em um registro binário')
+    run_parser.add_argument('--profile', help='Exporta o tempo de cada etapa por quadro (.csv ou .json)')
+    run_parser.add_argument('--export', help='Grava a execução em .gif, .png (APNG) ou, via ffmpeg, outro formato')
+    run_parser.add_argument('--encoder-command', help='Codificador que recebe quadros RGB24 256x256 a 60 Hz na entrada padrão')
+    run_parser.add_argument('--trace', help='Diretório para o relatório de PCs (.folded) e os mapas de calor (.ppm)')
+    run_parser.add_argument('--trace-every', type=int, default=1, help='Registra apenas um quadro a cada N')
+    add_engine_arguments(run_parser)
+    run_parser.set_defaults(handler=run_command)
+
+    replay_parser = subparsers.add_parser('replay', help='Reproduz um registro de teclas sem janela')
+    replay_parser.add_argument('rom', help='Caminho da ROM')
+    replay_parser.add_argument('input_log', help='Registro de teclas gravado com --record')
+    replay_parser.add_argument('--hashes', help='Grava o hash da página de vídeo de cada quadro')
+    replay_parser.add_argument('--verify', help='Registro de hashes de referência para comparar')
+    add_engine_arguments(replay_parser)
+    replay_parser.set_defaults(handler=replay_command)
+
+    farm_parser = subparsers.add_parser('farm', help='Executa um manifesto de ROMs em vários processos')
+    farm_parser.add_argument('manifest', help='Manifesto JSON com as tarefas (rom, keys, frames)')
+    farm_parser.add_argument('-w', '--workers', type=int, help='Número de processos (padrão: núcleos disponíveis)')
+    farm_parser.add_argument('-o', '--output', help='Arquivo JSON para gravar os resultados por tarefa')
+    add_engine_arguments(farm_parser)
+    farm_parser.set_defaults(handler=farm_command)
+
+    tile_parser = subparsers.add_parser('tile', help='Executa várias ROMs lado a lado em um único mosaico')
+    tile_parser.add_argument('manifest', help='Manifesto JSON com as instâncias (rom, keys, frames)')
+    tile_parser.add_argument('-w', '--workers', type=int, default=0, help='Processos auxiliares (0: tudo neste processo)')
+    tile_parser.add_argument('-c', '--columns', type=int, help='Colunas do mosaico (padrão: grade quase quadrada)')
+    tile_parser.add_argument('-n', '--frames', type=int, help='Número de quadros (padrão: o maior do manifesto)')
+    tile_parser.add_argument('--headless', action='store_true', help='Sem janela, o mais rápido possível')
+    tile_parser.add_argument('-o', '--output-dir', help='Diretório para gravar o mosaico em PPM (modo sem janela)')
+    tile_parser.add_argument('--dump-every', type=int, default=1, help='Grava um mosaico a cada N quadros')
+    add_engine_arguments(tile_parser)
+    tile_parser.set_defaults(handler=tile_command)
+
+    bench_parser = subparsers.add_parser('bench', help='Mede o desempenho com ROMs sintéticas')
+    bench_parser.add_argument('-n', '--frames', type=int, default=5, help='Quadros medidos por carga')
+    bench_parser.add_argument('-o', '--output', help='Arquivo JSON para gravar os resultados')
+    bench_parser.add_argument('-b', '--baseline', help='Resultados de referência para comparar')
+    bench_parser.add_argument('-t', '--threshold', type=float, default=0.10, help='Regressão relativa tolerada (0.10 = 10%%)')
+    bench_parser.set_defaults(handler=bench_command)
+
+    play_parser = subparsers.add_parser('play', help='Executa uma ROM em uma janela pygame')
+    play_parser.add_argument('rom', help='Caminho da ROM')
+    play_parser.add_argument('--mute', action='store_true', help='Desativa o som')
+    play_parser.add_argument('--record', help='Grava as teclas de cada quadro em um registro binário')
+    play_parser.add_argument('-s', '--scale', type=int, default=1, choices=range(1, 9), help='Escala inteira da janela (1 a 8)')
+    play_parser.add_argument('--rgb', action='store_true', help='Usa a conversão RGB com regiões alteradas (escala 1)')
+    play_parser.add_argument('--pipelined', action='store_true', help='Emula e apresenta em threads separados')
+    play_parser.add_argument('--perf', action='store_true', help='Mostra p50/p99 de cada etapa na tela')
+    play_parser.add_argument('--profile', help='Exporta o tempo de cada etapa por quadro (.csv ou .json)')
+    play_parser.add_argument('--export', help='Grava a execução em .gif, .png (APNG) ou, via ffmpeg, outro formato')
+    play_parser.add_argument('--keymap', help='Mapa de teclas: linhas "<nome da tecla pygame> <bit de 0 a 15>"')
+    play_parser.add_argument('--gamepad', type=int, nargs='?', const=0, help='Lê também o controle de índice N (padrão 0)')
+    add_engine_arguments(play_parser)
+    play_parser.set_defaults(handler=play_command)
+    return parser
+
+def run_command(args) -> int:
+    key_script = load_key_script(args.keys) if args.keys else None
+    audio = WavAudioSink(args.wav) if args.wav else None
+    driver = BytePusherHeadlessDriver(key_script, args.output_dir, args.dump_every, audio=audio)
+    if args.record:
+        driver = InputRecorder(driver, args.record)
+    if args.export or args.encoder_command:
+        driver = ExportDriver(driver, FrameExporter(create_writer(args.export, command=args.encoder_command)))
+    vm = BytePusherVM(driver, engine=args.engine)
+    vm.load(args.rom)
+    if args.profile:
+        vm.profiler = FrameProfiler(keep_history=True)
+        # O driver marca o tempo de gravação e hash de cada quadro
+        driver.profiler = vm.profiler
+    if args.trace:
+        vm.tracer = ExecutionTracer(args.trace_every)
+
+    try:
+        elapsed = run_headless(vm, args.frames)
+    finally:
+        driver.close()
+    if args.profile:
+        vm.profiler.export(args.profile)
+    if args.trace:
+        write_trace(vm.tracer, args.trace)
+    fps = args.frames / elapsed if elapsed > 0 else float('inf')
+    print(f"{args.frames} quadros em {elapsed:.3f}s ({fps:.2f} FPS)")
+    return 0
+
+def write_trace(tracer: ExecutionTracer, directory: str):
+    os.makedirs(directory, exist_ok=True)
+    tracer.export_folded(os.path.join(directory, 'pcs.folded'))
+    tracer.export_heatmap(os.path.join(directory, 'pc_heatmap.ppm'), 'pc')
+    tracer.export_heatmap(os.path.join(directory, 'write_heatmap.ppm'), 'write')
+    print(f"{tracer.traced_frames} de {tracer.frames} quadros registrados; PCs mais executados:")
+    for pc, count in tracer.top():
+        print(f"  {pc:#08x}: {count}")
+
+def replay_command(args) -> int:
+    if args.verify and not args.hashes:
+        print("--verify exige --hashes para gravar os hashes desta execução", file=sys.stderr)
+        return 2
+
+    driver = ReplayDriver(args.input_log, args.hashes)
+    vm = BytePusherVM(driver, engine=args.engine)
+    vm.load(args.rom)
+
+    try:
+        elapsed = run_headless(vm, len(driver))
+    finally:
+        driver.close()
+    fps = len(driver) / elapsed if elapsed > 0 else float('inf')
+    print(f"{len(driver)} quadros reproduzidos em {elapsed:.3f}s ({fps:.2f} FPS)")
+
+    if args.verify:
+        frame = verify_hash_logs(args.verify, args.hashes)
+        if frame is not None:
+            print(f"Divergência no quadro {frame}", file=sys.stderr)
+            return 1
+        print("Todos os quadros idênticos à referência")
+    return 0
+
+def farm_command(args) -> int:
+    report = run_farm(load_manifest(args.manifest), args.workers, args.engine)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fs:
+            json.dump(report, fs, indent=2)
+
+    for job in report['jobs']:
+        print(f"{job['rom']}: {job['frames']} quadros, {job['fps']:.2f} FPS, memória {job['memory_hash']}")
+    print(f"Total: {report['total_frames']} quadros em {report['seconds']:.3f}s ({report['fps']:.2f} FPS agregados)")
+    return 0
+
+def tile_command(args) -> int:
+    jobs = load_manifest(args.manifest)
+    frames = args.frames if args.frames is not None else max(job['frames'] for job in jobs)
+    with TiledRunner(jobs, args.workers, args.engine, args.columns) as runner:
+        if not args.headless:
+            run_tiled_viewer(runner, frames)
+            return 0
+
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+        start = time.perf_counter()
+        while runner.frames < frames:
+            runner.step()
+            if args.output_dir and (runner.frames - 1) % args.dump_every == 0:
+                write_rgb_ppm(os.path.join(args.output_dir, f"mosaic_{runner.frames - 1:06d}.ppm"), runner.render())
+        elapsed = time.perf_counter() - start
+    fps = frames / elapsed if elapsed > 0 else float('inf')
+    print(f"{runner.count} instâncias x {frames} quadros em {elapsed:.3f}s ({fps:.2f} mosaicos/s)")
+    return 0
+
+def bench_command(args) -> int:
+    results = run_benchmarks(args.frames)
+    for name, seconds in results['results'].items():
+        print(f"{name}: {seconds * 1000:.3f} ms")
+    if args.output:
+        save_results(results, args.output)
+
+    if args.baseline:
+        regressions = compare_results(results, load_results(args.baseline), args.threshold)
+        for regression in regressions:
+            print(f"Regressão: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("Nenhuma regressão em relação à referência")
+    return 0
+
+def play_command(args) -> int:
+    # Importado aqui para que o modo sem janela não inicialize o pygame
+    from byte_pusher_py.byte_pusher import BytePusher
+
+    profiler = FrameProfiler(keep_history=bool(args.profile)) if args.perf or args.profile else None
+    byte_pusher = BytePusher(engine=args.engine, audio=not args.mute, record=args.record, profiler=profiler,
+                             pipelined=args.pipelined, scale=args.scale, indexed=not args.rgb,
+                             keymap=load_keymap(args.keymap) if args.keymap else None, gamepad=args.gamepad,
+                             export=args.export)
+    byte_pusher.load_rom(args.rom)
+    byte_pusher.update()
+    byte_pusher.cleanup()
+    if args.profile:
+        profiler.export(args.profile)
+    return 0
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.log_dir is not None:
+        configure_logging(args.log_dir)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
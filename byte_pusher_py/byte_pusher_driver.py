@@ -0,0 +1,79 @@
+import numpy as np
+
+from byte_pusher_py.byte_pusher_audio import SAMPLES_PER_FRAME
+
+class BytePusherDriver:
+    # Interface de E/S da VM sem dependência de pygame: drivers com janela,
+    # sem janela e de replay herdam daqui
+    # Instrumentação opcional (FrameProfiler) e camadas desenhadas sobre cada quadro
+    profiler = None
+    overlays = ()
+    # Destino do som (PygameAudioSink, WavAudioSink ou None para mudo)
+    audio = None
+
+    def get_key_pressed(self):
+        return 0
+
+    def render_display_frame(self, data):
+        self.present()
+
+    def present(self, rects=None):
+        pass
+
+    def play_audio_frame(self, samples):
+        if self.audio is None:
+            return
+        if len(samples) < SAMPLES_PER_FRAME:
+            # Banco de som no fim da memória: completa com silêncio
+            samples = np.concatenate((samples, np.zeros(SAMPLES_PER_FRAME - len(samples), dtype=np.int8)))
+        self.audio.write(samples)
+
+    def close(self):
+        if self.audio is not None:
+            self.audio.close()
+            self.audio = None
+
+class DriverWrapper(BytePusherDriver):
+    # Envolve outro driver repassando todas as chamadas; instrumentação, camadas
+    # e som continuam no driver envolvido
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def profiler(self):
+        return self.driver.profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        self.driver.profiler = profiler
+
+    @property
+    def overlays(self):
+        return self.driver.overlays
+
+    @overlays.setter
+    def overlays(self, overlays):
+        self.driver.overlays = overlays
+
+    @property
+    def audio(self):
+        return self.driver.audio
+
+    @audio.setter
+    def audio(self, audio):
+        self.driver.audio = audio
+
+    def get_key_pressed(self):
+        return self.driver.get_key_pressed()
+
+    def render_display_frame(self, data):
+        self.driver.render_display_frame(data)
+
+    def present(self, rects=None):
+        self.driver.present(rects)
+
+    def play_audio_frame(self, samples):
+        self.driver.play_audio_frame(samples)
+
+    def close(self):
+        self.driver.close()
@@ -0,0 +1,200 @@
+import os
+import zlib
+import shlex
+import struct
+import subprocess
+import numpy as np
+
+from byte_pusher_py.byte_pusher_driver import DriverWrapper
+from byte_pusher_py.byte_pusher_palette import PAGE_SIZE, PALETTE, as_page
+
+# Cores distintas da paleta (cubo 6x6x6); os índices 216-255 são pretos
+PALETTE_COLORS = 216
+# Índice -> índice dentro das 216 cores (216-255 viram o preto de índice 0)
+COLOR_INDEX = np.where(np.arange(256) < PALETTE_COLORS, np.arange(256), 0).astype(np.uint8)
+# Navegadores tratam atrasos menores que 2 centésimos como 10: o GIF fica em até 50 quadros/s
+GIF_MAX_RATE = 50
+# Códigos LZW de 9 bits: um CLEAR a cada 254 literais impede a tabela de crescer
+GIF_CLEAR, GIF_END = 256, 257
+GIF_LITERALS_PER_CLEAR = 254
+
+def build_gif_layout():
+    # Posição de cada literal e de cada CLEAR na sequência de códigos de um quadro
+    groups = -(-PAGE_SIZE // GIF_LITERALS_PER_CLEAR)
+    literals = np.arange(PAGE_SIZE)
+    literal_positions = (literals // GIF_LITERALS_PER_CLEAR) * (GIF_LITERALS_PER_CLEAR + 1) + 1 + literals % GIF_LITERALS_PER_CLEAR
+    clear_positions = np.arange(groups) * (GIF_LITERALS_PER_CLEAR + 1)
+    code_count = PAGE_SIZE + groups + 1
+    # Bytes empacotados divididos em sub-blocos de até 255 bytes, cada um com o seu tamanho
+    data_size = -(-code_count * 9 // 8)
+    data = np.arange(data_size)
+    data_positions = (data // 255) * 256 + 1 + data % 255
+    block_count = -(-data_size // 255)
+    block_sizes = np.full(block_count, 255, dtype=np.uint8)
+    block_sizes[-1] = data_size - (block_count - 1) * 255
+    return literal_positions, clear_positions, code_count, data_positions, block_sizes
+
+class GifWriter:
+    def __init__(self, path: str, fps: int = 60):
+        self.fs = open(path, 'wb')
+        self.fps = fps
+        self.rate = min(fps, GIF_MAX_RATE)
+        self.frames = 0
+        self.written = 0
+        (self.literal_positions, self.clear_positions, self.code_count,
+         self.data_positions, self.block_sizes) = build_gif_layout()
+        self.shifts = np.arange(9, dtype=np.uint16)
+        # Cabeçalho, tabela global fixa de 256 cores e repetição infinita (NETSCAPE2.0)
+        self.fs.write(b"GIF89a" + struct.pack('<HHBBB', 256, 256, 0xF7, 0, 0) + PALETTE.tobytes())
+        self.fs.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def encode(self, pages: np.ndarray) -> np.ndarray:
+        # Fluxo LZW "sem compressão" de todos os quadros do lote de uma vez
+        count = len(pages)
+        codes = np.empty((count, self.code_count), dtype=np.uint16)
+        codes[:, self.literal_positions] = pages
+        codes[:, self.clear_positions] = GIF_CLEAR
+        codes[:, -1] = GIF_END
+        bits = ((codes[:, :, None] >> self.shifts) & 1).astype(np.uint8)
+        data = np.packbits(bits.reshape(count, -1), axis=1, bitorder='little')
+        blocks = np.zeros((count, len(self.block_sizes) * 256 + 1), dtype=np.uint8)
+        blocks[:, self.data_positions] = data
+        blocks[:, np.arange(len(self.block_sizes)) * 256] = self.block_sizes
+        # Último sub-bloco incompleto: remove o excesso e mantém o terminador vazio
+        end = self.data_positions[-1] + 1
+        return np.concatenate((blocks[:, :end], np.zeros((count, 1), dtype=np.uint8)), axis=1)
+
+    def write_batch(self, pages: np.ndarray):
+        # Acima de 50 quadros/s alguns quadros são descartados para manter a velocidade real
+        frames = self.frames + np.arange(len(pages))
+        keep = (frames * self.rate) // self.fps != ((frames - 1) * self.rate) // self.fps
+        keep[frames == 0] = True
+        self.frames += len(pages)
+        if not keep.any():
+            return
+        for stream in self.encode(pages[keep]):
+            # Atrasos acumulados em centésimos: a soma acompanha o tempo real
+            delay = round((self.written + 1) * 100 / self.rate) - round(self.written * 100 / self.rate)
+            self.fs.write(b"\x21\xF9\x04\x00" + struct.pack('<H', delay) + b"\x00\x00")
+            self.fs.write(b"\x2C" + struct.pack('<HHHHB', 0, 0, 256, 256, 0) + b"\x08")
+            self.fs.write(stream.tobytes())
+            self.written += 1
+
+    def close(self):
+        self.fs.write(b"\x3B")
+        self.fs.close()
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+class ApngWriter:
+    def __init__(self, path: str, fps: int = 60, level: int = 6):
+        self.fs = open(path, 'wb')
+        self.fps = fps
+        self.level = level
+        self.frames = 0
+        self.sequence = 0
+        # Linhas com o byte de filtro (0: nenhum) na frente, reaproveitadas entre lotes
+        self.rows = None
+        self.fs.write(b"\x89PNG\r\n\x1a\n")
+        self.fs.write(png_chunk(b'IHDR', struct.pack('>IIBBBBB', 256, 256, 8, 3, 0, 0, 0)))
+        self.fs.write(png_chunk(b'PLTE', PALETTE[:PALETTE_COLORS].tobytes()))
+        # Número de quadros desconhecido até o fim: o acTL é reescrito em close()
+        self.actl_offset = self.fs.tell()
+        self.fs.write(png_chunk(b'acTL', struct.pack('>II', 0, 0)))
+
+    def write_batch(self, pages: np.ndarray):
+        if self.rows is None or len(self.rows) < len(pages):
+            self.rows = np.zeros((len(pages), 256, 257), dtype=np.uint8)
+        rows = self.rows[:len(pages)]
+        np.take(COLOR_INDEX, pages.reshape(-1, 256, 256), out=rows[:, :, 1:])
+        for frame in rows:
+            self.fs.write(png_chunk(b'fcTL', struct.pack('>IIIIIHHBB', self.sequence, 256, 256, 0, 0,
+                                                         1, self.fps, 0, 0)))
+            self.sequence += 1
+            data = zlib.compress(frame.tobytes(), self.level)
+            if self.frames == 0:
+                # O primeiro quadro também é a imagem padrão do PNG
+                self.fs.write(png_chunk(b'IDAT', data))
+            else:
+                self.fs.write(png_chunk(b'fdAT', struct.pack('>I', self.sequence) + data))
+                self.sequence += 1
+            self.frames += 1
+
+    def close(self):
+        self.fs.write(png_chunk(b'IEND', b''))
+        self.fs.seek(self.actl_offset)
+        self.fs.write(png_chunk(b'acTL', struct.pack('>II', self.frames, 0)))
+        self.fs.close()
+
+def default_encoder_command(path: str, fps: int = 60) -> list[str]:
+    return ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', '256x256',
+            '-r', str(fps), '-i', '-', '-pix_fmt', 'yuv420p', path]
+
+class PipeWriter:
+    def __init__(self, command: list[str]):
+        # Quadros RGB24 de 256x256 crus na entrada padrão do codificador
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.rgb = None
+
+    def write_batch(self, pages: np.ndarray):
+        if self.rgb is None or len(self.rgb) < len(pages):
+            self.rgb = np.zeros((len(pages), PAGE_SIZE, 3), dtype=np.uint8)
+        rgb = self.rgb[:len(pages)]
+        np.take(PALETTE, pages, axis=0, out=rgb)
+        self.process.stdin.write(rgb.data)
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"O codificador terminou com código {self.process.returncode}")
+
+def create_writer(path: str, fps: int = 60, command: str | None = None):
+    if command is not None:
+        return PipeWriter(shlex.split(command))
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.gif':
+        return GifWriter(path, fps)
+    if extension in ('.png', '.apng'):
+        return ApngWriter(path, fps)
+    return PipeWriter(default_encoder_command(path, fps))
+
+class FrameExporter:
+    def __init__(self, writer, batch: int = 32):
+        # Lote pré-alocado: a memória usada não depende da duração da gravação
+        self.writer = writer
+        self.pages = np.zeros((batch, PAGE_SIZE), dtype=np.uint8)
+        self.count = 0
+        self.frames = 0
+
+    def add_frame(self, data):
+        as_page(data, self.pages[self.count])
+        self.count += 1
+        if self.count == len(self.pages):
+            self.flush()
+
+    def flush(self):
+        if self.count:
+            self.writer.write_batch(self.pages[:self.count])
+            self.frames += self.count
+            self.count = 0
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+class ExportDriver(DriverWrapper):
+    def __init__(self, driver, exporter: FrameExporter):
+        # Envolve qualquer driver e exporta cada página de vídeo entregue a ele
+        super().__init__(driver)
+        self.exporter = exporter
+
+    def render_display_frame(self, data):
+        self.exporter.add_frame(data)
+        self.driver.render_display_frame(data)
+
+    def close(self):
+        try:
+            self.exporter.close()
+        finally:
+            self.driver.close()
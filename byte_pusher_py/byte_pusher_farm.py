@@ -0,0 +1,104 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, hash_page, load_key_script
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+
+def load_manifest(path: str) -> list[dict]:
+    # Manifesto JSON: lista de {"rom": ..., "keys": ... (opcional), "frames": ...}
+    with open(path, 'r', encoding='utf-8') as fs:
+        manifest = json.load(fs)
+    base_dir = os.path.dirname(os.path.abspath(path))
+
+    jobs = []
+    for index, entry in enumerate(manifest):
+        if 'rom' not in entry or 'frames' not in entry:
+            raise ValueError(f"{path}: tarefa {index} precisa dos campos 'rom' e 'frames'")
+        keys = entry.get('keys')
+        jobs.append({
+            # Caminhos relativos são resolvidos a partir do diretório do manifesto
+            'rom': os.path.join(base_dir, entry['rom']),
+            'keys': os.path.join(base_dir, keys) if keys else None,
+            'frames': int(entry['frames']),
+        })
+    return jobs
+
+class SharedRomImages:
+    def __init__(self, roms):
+        # Cada ROM distinta é lida uma única vez e publicada em memória compartilhada
+        self.blocks = {}
+        try:
+            for rom in dict.fromkeys(roms):
+                with open(rom, 'rb') as fs:
+                    data = fs.read()
+                block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+                block.buf[:len(data)] = data
+                self.blocks[rom] = (block, len(data))
+        except BaseException:
+            self.close()
+            raise
+
+    def handle(self, rom: str) -> tuple[str, int]:
+        block, size = self.blocks[rom]
+        return block.name, size
+
+    def close(self):
+        for block, _ in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def create_job_vm(job: dict, rom_handle: tuple[str, int], engine: str = 'auto', **driver_options) -> BytePusherVM:
+    # VM sem janela com a ROM copiada da memória compartilhada publicada pelo processo principal
+    name, size = rom_handle
+    key_script = load_key_script(job['keys']) if job['keys'] else None
+    vm = BytePusherVM(BytePusherHeadlessDriver(key_script, **driver_options), engine=engine)
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        vm.load_image(block.buf[:size])
+    finally:
+        block.close()
+    return vm
+
+def run_job(job: dict, rom_handle: tuple[str, int], engine: str = 'auto') -> dict:
+    vm = create_job_vm(job, rom_handle, engine, hash_frames=True)
+    driver = vm.iodriver
+
+    start = time.perf_counter()
+    for _ in range(job['frames']):
+        vm.run()
+    elapsed = time.perf_counter() - start
+
+    return {
+        **job,
+        'memory_hash': hash_page(vm.view),
+        'frame_hashes': driver.frame_hashes,
+        'seconds': elapsed,
+        'fps': job['frames'] / elapsed if elapsed > 0 else float('inf'),
+    }
+
+def run_farm(jobs: list[dict], workers: int | None = None, engine: str = 'auto') -> dict:
+    start = time.perf_counter()
+    with SharedRomImages(job['rom'] for job in jobs) as images:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_job, job, images.handle(job['rom']), engine) for job in jobs]
+            results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    total_frames = sum(job['frames'] for job in jobs)
+    return {
+        'jobs': results,
+        'total_frames': total_frames,
+        'seconds': elapsed,
+        'fps': total_frames / elapsed if elapsed > 0 else float('inf'),
+    }
@@ -0,0 +1,69 @@
+import os
+import time
+import hashlib
+import numpy as np
+
+from byte_pusher_py.byte_pusher_driver import BytePusherDriver
+from byte_pusher_py.byte_pusher_input import ScriptedInput
+from byte_pusher_py.byte_pusher_palette import PAGE_SIZE, PALETTE, as_page
+
+def load_key_script(path: str) -> dict:
+    # Cada linha: "<quadro> <palavra de teclas>"; o estado vale até a próxima entrada
+    script = {}
+    with open(path, 'r', encoding='utf-8') as fs:
+        for line_number, line in enumerate(fs, start=1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            try:
+                frame, key = line.split()
+                script[int(frame, 0)] = int(key, 0) & 0xFFFF
+            except ValueError:
+                raise ValueError(f"{path}:{line_number}: linha inválida no script de teclas: {line!r}")
+    return script
+
+def write_ppm(path: str, data):
+    # Converte a página de vídeo pela paleta e grava um PPM binário (P6)
+    pixels = as_page(data, np.empty(PAGE_SIZE, dtype=np.uint8))
+    with open(path, 'wb') as fs:
+        fs.write(b"P6 256 256 255\n")
+        fs.write(PALETTE[pixels].tobytes())
+
+def hash_page(data) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+class BytePusherHeadlessDriver(BytePusherDriver):
+    def __init__(self, key_script: dict | None = None, output_dir: str | None = None, dump_every: int = 1,
+                 hash_frames: bool = False, audio=None):
+        self.input = ScriptedInput(key_script)
+        self.output_dir = output_dir
+        self.dump_every = dump_every
+        self.frame_hashes = [] if hash_frames else None
+        self.audio = audio
+        self.frame = 0
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+
+    def get_key_pressed(self):
+        return self.input.get_key_pressed()
+
+    def render_display_frame(self, data):
+        if self.output_dir is not None and self.frame % self.dump_every == 0:
+            write_ppm(os.path.join(self.output_dir, f"frame_{self.frame:06d}.ppm"), data)
+        if self.frame_hashes is not None:
+            self.frame_hashes.append(hash_page(data))
+        self.frame += 1
+        if self.profiler is not None:
+            self.profiler.mark('render_display_frame')
+
+def run_headless(vm, frames: int) -> float:
+    # Executa os quadros sem limitar a 60 FPS; retorna o tempo total em segundos
+    profiler = vm.profiler
+    start = time.perf_counter()
+    for _ in range(frames):
+        if profiler is not None:
+            profiler.begin()
+        vm.run()
+        if profiler is not None:
+            profiler.end()
+    return time.perf_counter() - start
@@ -0,0 +1,144 @@
+# Teclado hexadecimal do BytePusher: nome da tecla pygame -> bit da palavra de teclas
+DEFAULT_KEYMAP = {name: bit for bit, name in enumerate('0123456789abcdef')}
+
+def load_keymap(path: str) -> dict:
+    # Cada linha: "<nome da tecla pygame> <bit de 0 a 15>"
+    keymap = {}
+    with open(path, 'r', encoding='utf-8') as fs:
+        for line_number, line in enumerate(fs, start=1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            try:
+                name, bit = line.rsplit(None, 1)
+                keymap[name] = int(bit, 0)
+            except ValueError:
+                raise ValueError(f"{path}:{line_number}: linha inválida no mapa de teclas: {line!r}")
+    return keymap
+
+def build_bit_masks(mapping: dict, key_code=None) -> dict:
+    # Pré-calcula tecla/botão -> máscara do bit; nomes são convertidos por key_code
+    masks = {}
+    for key, bit in mapping.items():
+        if not 0 <= bit < 16:
+            raise ValueError(f"Bit inválido para {key!r}: {bit} (esperado de 0 a 15)")
+        masks[key_code(key) if isinstance(key, str) else key] = 1 << bit
+    return masks
+
+class InputBackend:
+    # Interface comum: a palavra de 16 bits é mantida a cada evento e lida em
+    # get_key_pressed sem nenhuma consulta ao estado do teclado
+    def __init__(self):
+        self.key_word = 0
+
+    def handle_event(self, event) -> bool:
+        return False
+
+    def get_key_pressed(self) -> int:
+        return self.key_word
+
+    def reset(self):
+        self.key_word = 0
+
+class KeyboardInput(InputBackend):
+    def __init__(self, keymap: dict | None = None):
+        # Importado aqui para que o núcleo da VM não dependa do pygame
+        import pygame
+        super().__init__()
+        self.pygame = pygame
+        self.keydown = pygame.KEYDOWN
+        self.keyup = pygame.KEYUP
+        self.focus_lost = pygame.WINDOWFOCUSLOST
+        self.masks = build_bit_masks(DEFAULT_KEYMAP if keymap is None else keymap, self.key_code)
+
+    def key_code(self, name: str) -> int:
+        # Nomes das constantes do pygame: 'a' -> K_a, 'up' -> K_UP, 'space' -> K_SPACE
+        # (pygame.key.key_code exigiria pygame.init())
+        for attribute in (f"K_{name}", f"K_{name.upper()}"):
+            code = getattr(self.pygame, attribute, None)
+            if code is not None:
+                return code
+        raise ValueError(f"Tecla desconhecida: {name!r}")
+
+    def remap(self, key, bit: int):
+        # Associa uma tecla (nome ou código pygame) a um bit; várias teclas podem dividir o mesmo bit
+        self.masks.update(build_bit_masks({key: bit}, self.key_code))
+        self.reset()
+
+    def handle_event(self, event) -> bool:
+        if event.type == self.keydown:
+            mask = self.masks.get(event.key)
+            if mask:
+                self.key_word |= mask
+                return True
+        elif event.type == self.keyup:
+            mask = self.masks.get(event.key)
+            if mask:
+                self.key_word &= ~mask
+                return True
+        elif event.type == self.focus_lost:
+            # Teclas soltas fora da janela nunca geram KEYUP
+            self.reset()
+        return False
+
+class GamepadInput(InputBackend):
+    def __init__(self, index: int = 0, buttons: dict | None = None):
+        import pygame
+        super().__init__()
+        pygame.joystick.init()
+        if index >= pygame.joystick.get_count():
+            raise ValueError(f"Controle {index} não encontrado ({pygame.joystick.get_count()} conectados)")
+        self.joystick = pygame.joystick.Joystick(index)
+        self.instance_id = self.joystick.get_instance_id()
+        self.button_down = pygame.JOYBUTTONDOWN
+        self.button_up = pygame.JOYBUTTONUP
+        # Padrão: botão N -> bit N
+        self.masks = build_bit_masks(buttons if buttons is not None else {button: button for button in range(16)})
+
+    def handle_event(self, event) -> bool:
+        if event.type not in (self.button_down, self.button_up) or event.instance_id != self.instance_id:
+            return False
+        mask = self.masks.get(event.button)
+        if not mask:
+            return False
+        if event.type == self.button_down:
+            self.key_word |= mask
+        else:
+            self.key_word &= ~mask
+        return True
+
+class ScriptedInput(InputBackend):
+    def __init__(self, script: dict | None = None):
+        # Quadro -> palavra de teclas; o estado vale até a próxima entrada
+        super().__init__()
+        self.script = script or {}
+        self.frame = 0
+
+    def get_key_pressed(self) -> int:
+        self.key_word = self.script.get(self.frame, self.key_word)
+        self.frame += 1
+        return self.key_word
+
+class CombinedInput(InputBackend):
+    # Vários dispositivos ao mesmo tempo (teclado e controle): a palavra é o OU de todos
+    def __init__(self, backends: list):
+        super().__init__()
+        self.backends = list(backends)
+
+    def handle_event(self, event) -> bool:
+        handled = False
+        for backend in self.backends:
+            handled = backend.handle_event(event) or handled
+        return handled
+
+    def get_key_pressed(self) -> int:
+        key_word = 0
+        for backend in self.backends:
+            key_word |= backend.get_key_pressed()
+        self.key_word = key_word
+        return key_word
+
+    def reset(self):
+        for backend in self.backends:
+            backend.reset()
+        self.key_word = 0
@@ -1,71 +1,137 @@
 import numpy as np
 import pygame
-import logging
 
-from byte_pusher_py.log_config import configure_test_logging
+from byte_pusher_py.byte_pusher_driver import BytePusherDriver
+from byte_pusher_py.byte_pusher_input import InputBackend, KeyboardInput
+from byte_pusher_py.byte_pusher_palette import PAGE_SIZE, PALETTE, as_page
 
-configure_test_logging()
+# Comparação entre quadros em blocos de 16x16 pixels (grade 16x16)
+TILE_SIZE = 16
+TILES = 256 // TILE_SIZE
 
-class BytePusherIODriver:
-    def __init__(self, screen):
+class BytePusherIODriver(BytePusherDriver):
+    def __init__(self, screen, audio=None, dirty_regions: bool = True, full_redraw_ratio: float = 0.5,
+                 input_backend: InputBackend | None = None):
         # Cria o buffer RGB (256x256 com 3 canais para RGB)
         self.rgbuffer = np.zeros((256, 256, 3), dtype=np.uint8)
+        # Página auxiliar para quadros incompletos
+        self.page = np.zeros(PAGE_SIZE, dtype=np.uint8)
         self.screen = screen
+        # Página apresentada no quadro anterior (None: o próximo quadro é completo)
+        self.previous = None
+        self.dirty_regions = dirty_regions
+        # Acima desta fração de blocos alterados, redesenhar tudo sai mais barato
+        self.full_redraw_ratio = full_redraw_ratio
+        self.overlay_rects = []
+        # Destino do som (PygameAudioSink, WavAudioSink ou None para mudo)
+        self.audio = audio
+        # Teclado por padrão; controle e roteiro usam a mesma interface
+        self.input = input_backend if input_backend is not None else KeyboardInput()
 
     def get_key_pressed(self):
-        key = 0
-        
-        # Captura o estado das teclas
-        pressed_keys = pygame.key.get_pressed()
-        
-        # Verifica quais teclas estão pressionadas
-        if pressed_keys[pygame.K_0]: key += 1
-        if pressed_keys[pygame.K_1]: key += 2
-        if pressed_keys[pygame.K_2]: key += 4
-        if pressed_keys[pygame.K_3]: key += 8
-        if pressed_keys[pygame.K_4]: key += 16
-        if pressed_keys[pygame.K_5]: key += 32
-        if pressed_keys[pygame.K_6]: key += 64
-        if pressed_keys[pygame.K_7]: key += 128
-        if pressed_keys[pygame.K_8]: key += 256
-        if pressed_keys[pygame.K_9]: key += 512
-        if pressed_keys[pygame.K_a]: key += 1024
-        if pressed_keys[pygame.K_b]: key += 2048
-        if pressed_keys[pygame.K_c]: key += 4096
-        if pressed_keys[pygame.K_d]: key += 8192
-        if pressed_keys[pygame.K_e]: key += 16384
-        if pressed_keys[pygame.K_f]: key += 32768
-        
-        return key
+        # Palavra mantida pelos eventos KEYDOWN/KEYUP repassados pelo laço principal
+        return self.input.get_key_pressed()
 
     def render_display_frame(self, data):
-        self.rgbuffer.fill(0)  # Limpa o buffer RGB
-        
-        for i, c in enumerate(data):
-            if c < 0 or c > 255:
-                continue  # Ignora valores fora do intervalo
+        pixels = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype=np.uint8)
+        if len(pixels) != PAGE_SIZE:
+            pixels = as_page(pixels, self.page)
 
-            # Cálculo dos componentes de cor
-            if c < 216:
-                red = (c // 36) % 6
-                green = (c // 6) % 6
-                blue = c % 6
-            else:
-                # Valores de 216 a 255 são pretos
-                red, green, blue = 0, 0, 0
+        page = pixels.reshape(256, 256)
+        changed = self.changed_tiles(page) if self.dirty_regions else None
+        if changed is None:
+            # Uma única consulta à paleta; a transposição converte [y, x] para o layout [x, y] do surfarray
+            np.take(PALETTE, page.T, axis=0, out=self.rgbuffer)
+            rects = None
+        else:
+            rects = self.tile_rects(changed)
+            for rect in rects:
+                np.take(PALETTE, page[rect.top:rect.bottom, rect.left:rect.right].T, axis=0,
+                        out=self.rgbuffer[rect.left:rect.right, rect.top:rect.bottom])
 
-            # Multiplicando por 51 para obter a intensidade correta (0 a 255)
-            red_color = red * 51
-            green_color = green * 51
-            blue_color = blue * 51
+        if self.dirty_regions:
+            if self.previous is None:
+                self.previous = np.empty((256, 256), dtype=np.uint8)
+            np.copyto(self.previous, page)
+        if self.profiler is not None:
+            self.profiler.mark('render_display_frame')
+        self.present(rects)
 
-            # Determinando a posição x, y
-            x = i % 256  # Posição x
-            y = i // 256  # Posição y
+    def changed_tiles(self, page):
+        if self.previous is None:
+            return None
+        # Compara os quadros bloco a bloco: [bloco y, linha, bloco x, coluna]
+        changed = (page != self.previous).reshape(TILES, TILE_SIZE, TILES, TILE_SIZE).any(axis=(1, 3))
+        # As camadas são redesenhadas a cada quadro: o conteúdo sob elas também
+        for rect in self.overlay_rects:
+            changed[rect.top // TILE_SIZE:(rect.bottom - 1) // TILE_SIZE + 1,
+                    rect.left // TILE_SIZE:(rect.right - 1) // TILE_SIZE + 1] = True
+        if changed.sum() > self.full_redraw_ratio * TILES * TILES:
+            return None
+        return changed
 
-            # Renderiza a cor no buffer
-            self.rgbuffer[x, y] = [red_color, green_color, blue_color]
+    def tile_rects(self, changed):
+        # Junta blocos alterados vizinhos de cada linha da grade em um único retângulo
+        rects = []
+        for tile_y in np.flatnonzero(changed.any(axis=1)):
+            columns = np.flatnonzero(changed[tile_y])
+            breaks = np.flatnonzero(np.diff(columns) > 1)
+            for start, end in zip(np.r_[0, breaks + 1], np.r_[breaks, len(columns) - 1]):
+                rects.append(pygame.Rect(columns[start] * TILE_SIZE, tile_y * TILE_SIZE,
+                                         (columns[end] - columns[start] + 1) * TILE_SIZE, TILE_SIZE))
+        return rects
 
-        # Atualiza a tela com o buffer RGB usando surfarray
-        pygame.surfarray.blit_array(self.screen, self.rgbuffer)
-        pygame.display.flip()
\ No newline at end of file
+    def present(self, rects=None):
+        if rects is None:
+            # Atualiza a tela com o buffer RGB usando surfarray
+            pygame.surfarray.blit_array(self.screen, self.rgbuffer)
+        else:
+            for rect in rects:
+                pygame.surfarray.blit_array(self.screen.subsurface(rect),
+                                            self.rgbuffer[rect.left:rect.right, rect.top:rect.bottom])
+        self.overlay_rects = [rect for overlay in self.overlays if (rect := overlay.draw(self.screen))]
+        if rects is None:
+            pygame.display.flip()
+        elif rects or self.overlay_rects:
+            pygame.display.update(rects + self.overlay_rects)
+        if self.profiler is not None:
+            self.profiler.mark('present')
+
+class BytePusherIndexedIODriver(BytePusherIODriver):
+    def __init__(self, screen, scale: int = 1, audio=None, input_backend: InputBackend | None = None):
+        if not 1 <= scale <= 8:
+            raise ValueError(f"Escala deve estar entre 1 e 8, recebido {scale}")
+        super().__init__(screen, audio, dirty_regions=False, input_backend=input_backend)
+        self.scale = scale
+        # Superfície de 8 bits com paleta fixa: cada quadro é só uma cópia dos bytes da página
+        palette = [tuple(color) for color in PALETTE]
+        self.surface = pygame.Surface((256, 256), depth=8)
+        self.surface.set_palette(palette)
+        # Destino pré-alocado da ampliação, no mesmo formato da origem
+        self.target = None
+        if scale > 1:
+            self.target = pygame.Surface((256 * scale, 256 * scale), depth=8)
+            self.target.set_palette(palette)
+
+    def render_display_frame(self, data):
+        pixels = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype=np.uint8)
+        if len(pixels) != PAGE_SIZE:
+            pixels = as_page(pixels, self.page)
+
+        # A página [y, x] já está no layout de linhas da superfície (pitch de 256 bytes)
+        self.surface.get_buffer().write(pixels.tobytes(), 0)
+        if self.profiler is not None:
+            self.profiler.mark('render_display_frame')
+        self.present()
+
+    def present(self, rects=None):
+        if self.target is not None:
+            pygame.transform.scale(self.surface, self.target.get_size(), self.target)
+            self.screen.blit(self.target, (0, 0))
+        else:
+            self.screen.blit(self.surface, (0, 0))
+        for overlay in self.overlays:
+            overlay.draw(self.screen)
+        pygame.display.flip()
+        if self.profiler is not None:
+            self.profiler.mark('present')
@@ -0,0 +1,203 @@
+from byte_pusher_py.byte_pusher_memory import DIRTY_PAGE_SHIFT
+
+PAGE_SHIFT = 8
+MAX_BLOCK_LENGTH = 256
+# Blocos (ou páginas de código) invalidados mais vezes que isso passam a ser interpretados
+MAX_RECOMPILATIONS = 2
+INSTRUCTION_SIZE = 9
+
+class BytePusherJIT:
+    def __init__(self, vm, max_block_length: int = MAX_BLOCK_LENGTH):
+        self.vm = vm
+        self.max_block_length = max_block_length
+        self.reset()
+
+    def reset(self):
+        # Blocos compilados indexados pelo endereço inicial: (função, nº de instruções, fim)
+        self.blocks = {}
+        # Páginas de 256 bytes que contêm código compilado -> conjunto de blocos
+        self.page_blocks = {}
+        self.code_pages = bytearray((0xFFFFFF >> PAGE_SHIFT) + 1)
+        # Código que se reescreve a todo momento não compensa recompilar
+        self.recompilations = {}
+        self.interpreted = set()
+        # Páginas cujo código o próprio programa reescreve: nenhum bloco começa nelas
+        self.page_rewrites = {}
+        self.interpreted_pages = bytearray(len(self.code_pages))
+        self.memory = None
+
+    def invalidate(self, start: int, length: int = 1) -> bool:
+        # Remove todos os blocos cujo código intersecta [start, start + length)
+        end = start + length
+        dropped = False
+        for page in range(start >> PAGE_SHIFT, ((end - 1) >> PAGE_SHIFT) + 1):
+            if not self.code_pages[page]:
+                continue
+            for block_start in list(self.page_blocks[page]):
+                block = self.blocks.get(block_start)
+                if block is not None and block_start < end and start < block[2]:
+                    self._drop_block(block_start)
+                    dropped = True
+        return dropped
+
+    def code_written(self, address: int):
+        # Escrita do próprio programa sobre código compilado
+        if self.invalidate(address):
+            self.count_rewrite(address >> PAGE_SHIFT)
+
+    def count_rewrite(self, page: int):
+        rewrites = self.page_rewrites.get(page, 0) + 1
+        self.page_rewrites[page] = rewrites
+        if rewrites >= MAX_RECOMPILATIONS:
+            # Página reescrita a todo quadro: passa inteira para o interpretador
+            self.interpreted_pages[page] = 1
+            for block_start in list(self.page_blocks.get(page, ())):
+                if block_start >> PAGE_SHIFT == page:
+                    self._drop_block(block_start)
+
+    def _drop_block(self, block_start: int):
+        _, _, block_end = self.blocks.pop(block_start)
+        count = self.recompilations.get(block_start, 0) + 1
+        self.recompilations[block_start] = count
+        if count >= MAX_RECOMPILATIONS:
+            self.interpreted.add(block_start)
+        for page in range(block_start >> PAGE_SHIFT, ((block_end - 1) >> PAGE_SHIFT) + 1):
+            blocks = self.page_blocks[page]
+            blocks.discard(block_start)
+            if not blocks:
+                del self.page_blocks[page]
+                self.code_pages[page] = 0
+
+    def execute(self, pc: int, instruction_counter: int) -> int:
+        memory = self.vm.memory
+        if memory is not self.memory:
+            # A memória foi substituída: nenhum bloco em cache é confiável
+            self.reset()
+            self.memory = memory
+
+        blocks = self.blocks
+        interpreted = self.interpreted
+        interpreted_pages = self.interpreted_pages
+        interpret = self._interpret if self.vm.dirty_pages is None else self._interpret_tracked
+        while instruction_counter > 0:
+            block = blocks.get(pc)
+            if block is None and pc not in interpreted and not interpreted_pages[pc >> PAGE_SHIFT]:
+                block = self._compile(pc)
+            if block is not None and block[1] <= instruction_counter:
+                pc = block[0]()
+                instruction_counter -= block[1]
+                continue
+            # Sem bloco possível ou orçamento insuficiente: interpreta localmente
+            # até chegar a um endereço com bloco compilado (ou compilável)
+            pc, instruction_counter = interpret(pc, instruction_counter)
+        return pc
+
+    def _interpret(self, pc: int, instruction_counter: int) -> tuple[int, int]:
+        view = self.vm.view
+        limit = len(view) - 1
+        code_pages = self.code_pages
+        blocks = self.blocks
+        interpreted = self.interpreted
+        interpreted_pages = self.interpreted_pages
+        while instruction_counter:
+            source_index = (view[pc] << 16) | (view[pc + 1] << 8) | view[pc + 2]
+            target_index = (view[pc + 3] << 16) | (view[pc + 4] << 8) | view[pc + 5]
+            if target_index < limit:
+                view[target_index] = view[source_index]
+                if code_pages[target_index >> PAGE_SHIFT]:
+                    self.code_written(target_index)
+            pc = (view[pc + 6] << 16) | (view[pc + 7] << 8) | view[pc + 8]
+            instruction_counter -= 1
+            # Páginas interpretadas não têm blocos: só as demais exigem consultar o cache
+            if interpreted_pages[pc >> PAGE_SHIFT]:
+                continue
+            if pc in blocks or pc not in interpreted:
+                break
+        return pc, instruction_counter
+
+    def _interpret_tracked(self, pc: int, instruction_counter: int) -> tuple[int, int]:
+        # Mesmo laço, marcando a página de cada escrita para os snapshots
+        view = self.vm.view
+        dirty = self.vm.dirty_pages
+        limit = len(view) - 1
+        code_pages = self.code_pages
+        blocks = self.blocks
+        interpreted = self.interpreted
+        interpreted_pages = self.interpreted_pages
+        while instruction_counter:
+            source_index = (view[pc] << 16) | (view[pc + 1] << 8) | view[pc + 2]
+            target_index = (view[pc + 3] << 16) | (view[pc + 4] << 8) | view[pc + 5]
+            if target_index < limit:
+                view[target_index] = view[source_index]
+                dirty[target_index >> DIRTY_PAGE_SHIFT] = 1
+                if code_pages[target_index >> PAGE_SHIFT]:
+                    self.code_written(target_index)
+            pc = (view[pc + 6] << 16) | (view[pc + 7] << 8) | view[pc + 8]
+            instruction_counter -= 1
+            if interpreted_pages[pc >> PAGE_SHIFT]:
+                continue
+            if pc in blocks or pc not in interpreted:
+                break
+        return pc, instruction_counter
+
+    def _compile(self, start: int):
+        vm = self.vm
+        memory = vm.memory
+        limit = len(memory) - 1
+        dirty = vm.dirty_pages
+
+        # Descobre a sequência linear: cada salto aponta para a instrução seguinte
+        instructions = []
+        # Endereço escrito -> índice da primeira instrução do bloco que o escreve
+        writers = {}
+        pc = start
+        while len(instructions) < self.max_block_length:
+            if pc + INSTRUCTION_SIZE > len(memory):
+                break
+            # Uma escrita anterior atinge esta instrução: o bloco termina na escritora
+            hit = min((writers[address] for address in range(pc, pc + INSTRUCTION_SIZE) if address in writers), default=None)
+            if hit is not None:
+                instructions = instructions[:hit + 1]
+                # Código que reescreve o seguinte conta como reescrita antes mesmo de executar
+                self.count_rewrite(pc >> PAGE_SHIFT)
+                break
+            source_index = vm.get_address(pc, 3)
+            target_index = vm.get_address(pc + 3, 3)
+            instructions.append((source_index, target_index))
+            # Escrita no código já percorrido (inclusive nesta instrução) também encerra o bloco
+            if start <= target_index < pc + INSTRUCTION_SIZE:
+                self.count_rewrite(target_index >> PAGE_SHIFT)
+                break
+            writers.setdefault(target_index, len(instructions) - 1)
+            if vm.get_address(pc + 6, 3) != pc + INSTRUCTION_SIZE:
+                break
+            pc += INSTRUCTION_SIZE
+        if not instructions or self.interpreted_pages[start >> PAGE_SHIFT]:
+            return None
+        block_end = start + len(instructions) * INSTRUCTION_SIZE
+
+        lines = ["def block():"]
+        for source_index, target_index in instructions:
+            if target_index < 0 or target_index >= limit:
+                # O interpretador ignora escritas fora do limite
+                lines.append("    pass")
+                continue
+            lines.append(f"    m[{target_index}] = m[{source_index}]")
+            if dirty is not None:
+                lines.append(f"    d[{target_index >> DIRTY_PAGE_SHIFT}] = 1")
+            lines.append(f"    if cp[{target_index >> PAGE_SHIFT}]: inv({target_index})")
+        # O destino do último salto é lido em tempo de execução (pode ter sido sobrescrito)
+        jump = block_end - 3
+        lines.append(f"    return (m[{jump}] << 16) | (m[{jump + 1}] << 8) | m[{jump + 2}]")
+
+        # A memoryview devolve int nativo tanto para bytearray quanto para NumPy
+        namespace = {"m": vm.view, "cp": self.code_pages, "inv": self.code_written, "d": dirty}
+        exec(compile("\n".join(lines), f"<bytepusher-block-{start:06x}>", "exec"), namespace)
+
+        block = (namespace["block"], len(instructions), block_end)
+        self.blocks[start] = block
+        for page in range(start >> PAGE_SHIFT, ((block_end - 1) >> PAGE_SHIFT) + 1):
+            self.page_blocks.setdefault(page, set()).add(start)
+            self.code_pages[page] = 1
+        return block
+
@@ -0,0 +1,34 @@
+import numpy as np
+
+MEMORY_SIZE = 0xFFFFFF
+
+def create_numpy_memory(size: int = MEMORY_SIZE) -> np.ndarray:
+    return np.zeros(size, dtype=np.uint8)
+
+def create_bytearray_memory(size: int = MEMORY_SIZE) -> bytearray:
+    # Indexar um bytearray devolve int nativo, bem mais rápido que um escalar NumPy
+    return bytearray(size)
+
+# Backends disponíveis: nome -> fábrica do buffer de memória
+MEMORY_BACKENDS = {
+    'numpy': create_numpy_memory,
+    'bytearray': create_bytearray_memory,
+}
+
+def create_memory(backend: str = 'bytearray', size: int = MEMORY_SIZE):
+    try:
+        factory = MEMORY_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Backend de memória desconhecido: {backend!r} (disponíveis: {', '.join(MEMORY_BACKENDS)})")
+    return factory(size)
+
+def as_array(memory) -> np.ndarray:
+    # Visão NumPy sem cópia sobre qualquer buffer de memória
+    return np.frombuffer(memory, dtype=np.uint8)
+
+# Granularidade do rastreamento de escritas (páginas de 4 KiB)
+DIRTY_PAGE_SHIFT = 12
+DIRTY_PAGE_SIZE = 1 << DIRTY_PAGE_SHIFT
+
+def dirty_page_count(size: int) -> int:
+    return (size + DIRTY_PAGE_SIZE - 1) >> DIRTY_PAGE_SHIFT
@@ -0,0 +1,53 @@
+from importlib.util import find_spec
+import numpy as np
+
+from byte_pusher_py.byte_pusher_memory import DIRTY_PAGE_SHIFT
+
+# Numba é opcional: sem ele a VM usa o interpretador Python. Só é importado
+# (centenas de milissegundos) quando uma VM escolhe o motor nativo; estar
+# instalado não garante que a importação funcione (ex.: NumPy incompatível)
+NATIVE_AVAILABLE = find_spec('numba') is not None
+
+def byte_byte_jump_kernel(memory, pc, instruction_counter, dirty, track_writes):
+    # Executa até instruction_counter instruções sobre a memória (array uint8).
+    # Sem verificação de limites no código compilado: qualquer acesso fora da
+    # memória interrompe o laço e devolve o restante para o interpretador Python,
+    # que reproduz o mesmo erro.
+    size = memory.shape[0]
+    limit = size - 1
+    while instruction_counter > 0:
+        if pc + 9 > size:
+            break
+        source_index = (np.int64(memory[pc]) << 16) | (np.int64(memory[pc + 1]) << 8) | np.int64(memory[pc + 2])
+        target_index = (np.int64(memory[pc + 3]) << 16) | (np.int64(memory[pc + 4]) << 8) | np.int64(memory[pc + 5])
+        if target_index < limit:
+            if source_index >= size:
+                break
+            memory[target_index] = memory[source_index]
+            if track_writes:
+                dirty[target_index >> DIRTY_PAGE_SHIFT] = 1
+        pc = (np.int64(memory[pc + 6]) << 16) | (np.int64(memory[pc + 7]) << 8) | np.int64(memory[pc + 8])
+        instruction_counter -= 1
+    return pc, instruction_counter
+
+native_byte_byte_jump = None
+
+def load_native_kernel():
+    global native_byte_byte_jump
+    if native_byte_byte_jump is None:
+        if not NATIVE_AVAILABLE:
+            raise ImportError("O motor nativo exige o Numba instalado")
+        import numba
+        # nogil: o quadro inteiro roda sem segurar o GIL (útil no modo em pipeline)
+        native_byte_byte_jump = numba.njit(cache=True, nogil=True)(byte_byte_jump_kernel)
+    return native_byte_byte_jump
+
+def native_available() -> bool:
+    try:
+        load_native_kernel()
+    except ImportError:
+        return False
+    return True
+
+# Usado quando o rastreamento de escritas está desligado
+NO_DIRTY_PAGES = np.zeros(1, dtype=np.uint8)
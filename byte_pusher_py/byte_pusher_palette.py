@@ -0,0 +1,23 @@
+import numpy as np
+
+def build_palette() -> np.ndarray:
+    # Tabela 256x3: cores 0-215 formam um cubo 6x6x6, 216-255 são pretas
+    palette = np.zeros((256, 3), dtype=np.uint8)
+    colors = np.arange(216)
+    palette[:216, 0] = (colors // 36) % 6 * 51
+    palette[:216, 1] = (colors // 6) % 6 * 51
+    palette[:216, 2] = colors % 6 * 51
+    return palette
+
+PALETTE = build_palette()
+
+# Bytes de uma página de vídeo 256x256
+PAGE_SIZE = 256 * 256
+
+def as_page(data, out: np.ndarray) -> np.ndarray:
+    # Copia a página para out (PAGE_SIZE bytes); página incompleta (fim da memória): o restante fica preto
+    pixels = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype=np.uint8)
+    length = min(len(pixels), PAGE_SIZE)
+    out[:length] = pixels[:length]
+    out[length:] = 0
+    return out
@@ -0,0 +1,116 @@
+import csv
+import json
+import time
+import numpy as np
+
+# Seções medidas em cada quadro, na ordem em que acontecem
+SECTIONS = ('handle_events', 'update_pressed_keys', 'process_byte_byte_jump', 'play_audio_frame',
+            'render_display_frame', 'present')
+
+class FrameProfiler:
+    def __init__(self, window: int = 600, keep_history: bool = False):
+        # Janela circular pré-alocada: uma linha por quadro, uma coluna por seção (segundos)
+        self.samples = np.zeros((window, len(SECTIONS)), dtype=np.float64)
+        self.columns = {section: column for column, section in enumerate(SECTIONS)}
+        self.window = window
+        self.frames = 0
+        self.row = self.samples[0]
+        self.last = 0.0
+        # Histórico completo opcional para exportação
+        self.history = [] if keep_history else None
+
+    def begin(self):
+        self.row = self.samples[self.frames % self.window]
+        self.row.fill(0)
+        self.last = time.perf_counter()
+
+    def mark(self, section: str):
+        # Atribui à seção o tempo decorrido desde a última marcação
+        now = time.perf_counter()
+        self.row[self.columns[section]] += now - self.last
+        self.last = now
+
+    def end(self):
+        if self.history is not None:
+            self.history.append(self.row.copy())
+        self.frames += 1
+
+    def recent(self) -> np.ndarray:
+        return self.samples[:min(self.frames, self.window)]
+
+    def stats(self) -> dict:
+        samples = self.recent()
+        if not len(samples):
+            return {}
+        p50, p99 = np.percentile(samples, [50, 99], axis=0)
+        totals = samples.sum(axis=1)
+        stats = {section: {'p50': p50[i], 'p99': p99[i]} for i, section in enumerate(SECTIONS)}
+        stats['frame'] = {'p50': float(np.percentile(totals, 50)), 'p99': float(np.percentile(totals, 99))}
+        return stats
+
+    def rows(self) -> np.ndarray:
+        if self.history is not None:
+            return np.array(self.history).reshape(-1, len(SECTIONS))
+        # Sem histórico: a janela atual, da mais antiga para a mais recente
+        return np.roll(self.recent(), -(self.frames % self.window) if self.frames > self.window else 0, axis=0)
+
+    def export_csv(self, path: str):
+        with open(path, 'w', newline='', encoding='utf-8') as fs:
+            writer = csv.writer(fs)
+            writer.writerow(('frame',) + SECTIONS)
+            first = self.frames - len(self.rows())
+            for offset, row in enumerate(self.rows()):
+                writer.writerow([first + offset] + [f"{value:.9f}" for value in row])
+
+    def export_json(self, path: str):
+        stats = {section: {key: float(value) for key, value in values.items()} for section, values in self.stats().items()}
+        with open(path, 'w', encoding='utf-8') as fs:
+            json.dump({'sections': SECTIONS, 'frames': self.frames, 'stats': stats,
+                       'samples': self.rows().tolist()}, fs, indent=2)
+
+    def export(self, path: str):
+        if path.endswith('.json'):
+            self.export_json(path)
+        else:
+            self.export_csv(path)
+
+class TextOverlay:
+    def __init__(self, font, position=(10, 10), color=(255, 255, 255)):
+        # Superfícies de texto em cache: a fonte só é renderizada quando o texto muda
+        self.font = font
+        self.position = position
+        self.color = color
+        self.lines = ()
+        self.surfaces = []
+
+    def set_lines(self, lines):
+        lines = tuple(lines)
+        if lines == self.lines:
+            return
+        self.lines = lines
+        self.surfaces = [self.font.render(line, True, self.color, (0, 0, 0)) for line in lines]
+
+    def draw(self, screen):
+        # Devolve a área desenhada, para atualizações parciais da tela
+        x, y = self.position
+        area = None
+        for surface in self.surfaces:
+            rect = screen.blit(surface, (x, y))
+            area = rect if area is None else area.union(rect)
+            y += surface.get_height()
+        return area
+
+class PerfOverlay(TextOverlay):
+    def __init__(self, font, profiler: FrameProfiler, refresh_every: int = 30, **kwargs):
+        super().__init__(font, **kwargs)
+        self.profiler = profiler
+        self.refresh_every = refresh_every
+
+    def update(self, fps: float):
+        # Recalcula os percentis só a cada N quadros para manter o custo baixo
+        if self.profiler.frames % self.refresh_every:
+            return
+        lines = [f'FPS: {fps:.1f}']
+        for section, values in self.profiler.stats().items():
+            lines.append(f"{section[:12]}: {values['p50'] * 1000:.2f}/{values['p99'] * 1000:.2f} ms")
+        self.set_lines(lines)
@@ -0,0 +1,116 @@
+import time
+import queue
+import threading
+import numpy as np
+
+from byte_pusher_py.byte_pusher_palette import PAGE_SIZE, as_page
+
+class FramePacer:
+    def __init__(self, rate: float = 60.0, max_lag: int = 5, clock=time.perf_counter, sleep=time.sleep):
+        self.period = 1.0 / rate
+        # Atraso máximo (em quadros) antes de desistir de recuperar o tempo perdido
+        self.max_lag = max_lag
+        self.clock = clock
+        self.sleep = sleep
+        self.deadline = None
+
+    def wait(self):
+        # O prazo avança em passos fixos a partir do anterior, e não de "agora":
+        # atrasos de um quadro são compensados no seguinte e não se acumulam
+        now = self.clock()
+        if self.deadline is None:
+            self.deadline = now
+        self.deadline += self.period
+        delay = self.deadline - now
+        if delay > 0:
+            self.sleep(delay)
+        elif -delay > self.max_lag * self.period:
+            self.deadline = now
+
+class PipelinedRunner:
+    def __init__(self, vm, buffers: int = 3, pacer: FramePacer | None = None):
+        if buffers < 2:
+            raise ValueError("O modo em pipeline precisa de pelo menos 2 buffers")
+        self.vm = vm
+        self.pacer = pacer
+        # Buffers reutilizáveis: livres -> prontos (emulação) -> livres (apresentação)
+        self.free = queue.Queue()
+        self.ready = queue.Queue()
+        for _ in range(buffers):
+            self.free.put(np.zeros(PAGE_SIZE, dtype=np.uint8))
+        self.produced = 0
+        self.presented = 0
+        self.skipped = 0
+        self.error = None
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.emulate, name='bytepusher-emulation', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def acquire_buffer(self) -> np.ndarray:
+        try:
+            return self.free.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            # Apresentação atrasada: descarta o quadro pronto mais antigo
+            buffer = self.ready.get_nowait()
+            self.skipped += 1
+            return buffer
+        except queue.Empty:
+            pass
+        # O apresentador está com os buffers; espera um ser devolvido
+        while self.running:
+            try:
+                return self.free.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def emulate(self):
+        vm = self.vm
+        try:
+            while self.running:
+                if self.pacer is not None:
+                    self.pacer.wait()
+                page = vm.emulate_frame()
+                buffer = self.acquire_buffer()
+                if buffer is None:
+                    break
+                self.ready.put(as_page(page, buffer))
+                self.produced += 1
+        except BaseException as error:
+            self.error = error
+            self.running = False
+
+    def present_latest(self, timeout: float = 0.1) -> bool:
+        if self.error is not None:
+            raise self.error
+        try:
+            buffer = self.ready.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        # Apenas o quadro mais recente é apresentado; os intermediários são pulados
+        while True:
+            try:
+                newer = self.ready.get_nowait()
+            except queue.Empty:
+                break
+            self.free.put(buffer)
+            self.skipped += 1
+            buffer = newer
+        try:
+            self.vm.iodriver.render_display_frame(buffer)
+        finally:
+            self.free.put(buffer)
+        self.presented += 1
+        return True
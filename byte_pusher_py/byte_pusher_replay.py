@@ -0,0 +1,79 @@
+import numpy as np
+
+from byte_pusher_py.byte_pusher_driver import DriverWrapper
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, hash_page
+
+INPUT_LOG_MAGIC = b'BPINPUT\x01'
+HASH_LOG_MAGIC = b'BPHASH\x01\x10'  # O último byte é o tamanho de cada hash
+HASH_SIZE = 16
+
+def read_input_log(path: str) -> np.ndarray:
+    with open(path, 'rb') as fs:
+        if fs.read(len(INPUT_LOG_MAGIC)) != INPUT_LOG_MAGIC:
+            raise ValueError(f"{path} não é um registro de teclas BytePusher")
+        data = fs.read()
+    if len(data) % 2:
+        raise ValueError(f"{path}: registro de teclas truncado")
+    # Uma palavra de 16 bits big-endian por quadro
+    return np.frombuffer(data, dtype='>u2').astype(np.uint16)
+
+def read_hash_log(path: str) -> list[bytes]:
+    with open(path, 'rb') as fs:
+        if fs.read(len(HASH_LOG_MAGIC)) != HASH_LOG_MAGIC:
+            raise ValueError(f"{path} não é um registro de hashes BytePusher")
+        data = fs.read()
+    return [data[i:i + HASH_SIZE] for i in range(0, len(data) - len(data) % HASH_SIZE, HASH_SIZE)]
+
+def verify_hash_logs(reference: str, candidate: str) -> int | None:
+    # Devolve o primeiro quadro divergente, ou None se os registros forem idênticos
+    expected = read_hash_log(reference)
+    actual = read_hash_log(candidate)
+    for frame, (a, b) in enumerate(zip(expected, actual)):
+        if a != b:
+            return frame
+    if len(expected) != len(actual):
+        return min(len(expected), len(actual))
+    return None
+
+class InputRecorder(DriverWrapper):
+    def __init__(self, driver, path: str):
+        # Envolve qualquer driver e grava a palavra de teclas entregue a cada quadro
+        super().__init__(driver)
+        self.log = open(path, 'wb')
+        self.log.write(INPUT_LOG_MAGIC)
+
+    def get_key_pressed(self):
+        key = self.driver.get_key_pressed()
+        self.log.write((key & 0xFFFF).to_bytes(2, 'big'))
+        return key
+
+    def close(self):
+        self.log.close()
+        self.driver.close()
+
+class ReplayDriver(BytePusherHeadlessDriver):
+    def __init__(self, input_log: str, hash_log: str | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.keys = read_input_log(input_log)
+        self.hash_log = None
+        if hash_log is not None:
+            self.hash_log = open(hash_log, 'wb')
+            self.hash_log.write(HASH_LOG_MAGIC)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def get_key_pressed(self):
+        # Após o fim do registro nenhuma tecla é pressionada
+        return int(self.keys[self.frame]) if self.frame < len(self.keys) else 0
+
+    def render_display_frame(self, data):
+        if self.hash_log is not None:
+            self.hash_log.write(bytes.fromhex(hash_page(data)))
+        super().render_display_frame(data)
+
+    def close(self):
+        if self.hash_log is not None:
+            self.hash_log.close()
+            self.hash_log = None
+        super().close()
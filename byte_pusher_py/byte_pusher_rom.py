@@ -0,0 +1,67 @@
+import os
+import mmap
+import hashlib
+import logging
+from collections import OrderedDict
+
+def check_rom_size(rom: str, size: int, capacity: int, strict: bool):
+    if size <= capacity:
+        return
+    message = f"ROM {rom} tem {size} bytes e excede a memória de {capacity} bytes"
+    if strict:
+        raise ValueError(message)
+    logging.warning(f"{message}; truncando")
+
+def read_rom_into(rom: str, buffer: memoryview, strict: bool = False, use_mmap: bool = False) -> int:
+    # Lê a ROM diretamente no buffer de destino, sem cópias intermediárias por byte
+    capacity = len(buffer)
+    with open(rom, 'rb') as fs:
+        if use_mmap:
+            size = os.fstat(fs.fileno()).st_size
+            check_rom_size(rom, size, capacity, strict)
+            length = min(size, capacity)
+            if length == 0:
+                return 0  # Arquivos vazios não podem ser mapeados
+            with mmap.mmap(fs.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # Cópia única do mapeamento para a memória; a visão é liberada antes de fechar o mmap
+                with memoryview(mapped) as source:
+                    buffer[:length] = source[:length]
+            return length
+
+        # Verificado antes da leitura: no modo estrito a memória não pode ser alterada
+        check_rom_size(rom, os.fstat(fs.fileno()).st_size, capacity, strict)
+        length = 0
+        while length < capacity and (read := fs.readinto(buffer[length:])):
+            length += read
+    return length
+
+class RomCache:
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        # (caminho, tamanho, mtime) -> hash do conteúdo
+        self.digests = {}
+        # hash do conteúdo -> imagem da ROM (imutável, compartilhada entre arquivos iguais)
+        self.images = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, rom: str) -> bytes:
+        stat = os.stat(rom)
+        key = (os.path.realpath(rom), stat.st_size, stat.st_mtime_ns)
+        digest = self.digests.get(key)
+        if digest is not None and digest in self.images:
+            self.hits += 1
+            self.images.move_to_end(digest)
+            return self.images[digest]
+
+        self.misses += 1
+        image = bytearray(stat.st_size)
+        length = read_rom_into(rom, memoryview(image))
+        image = bytes(image[:length])
+        digest = hashlib.blake2b(image, digest_size=16).hexdigest()
+        self.digests[key] = digest
+        self.images[digest] = image
+        self.images.move_to_end(digest)
+        while len(self.images) > self.max_entries:
+            self.images.popitem(last=False)
+        return image
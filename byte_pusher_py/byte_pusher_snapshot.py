@@ -0,0 +1,97 @@
+import gzip
+import struct
+from bisect import bisect_right
+import numpy as np
+
+from byte_pusher_py.byte_pusher_memory import DIRTY_PAGE_SHIFT, DIRTY_PAGE_SIZE
+
+SNAPSHOT_MAGIC = b'BPSNAP\x01'
+
+class SnapshotChain:
+    def __init__(self, vm):
+        self.vm = vm
+        vm.enable_write_tracking()
+        # Cada snapshot guarda só as páginas alteradas desde o anterior: página -> bytes
+        self.snapshots = []
+        # Página -> índices (crescentes) dos snapshots que guardam uma versão dela
+        self.history = {}
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    def dirty_pages(self):
+        return np.flatnonzero(np.frombuffer(self.vm.dirty_pages, dtype=np.uint8)).tolist()
+
+    def read_page(self, page: int) -> bytes:
+        return bytes(self.vm.view[page << DIRTY_PAGE_SHIFT:(page + 1) << DIRTY_PAGE_SHIFT])
+
+    def take(self) -> int:
+        vm = self.vm
+        # O primeiro snapshot é a base completa; os demais são deltas
+        pages = range(len(vm.dirty_pages)) if not self.snapshots else self.dirty_pages()
+        index = len(self.snapshots)
+        self.snapshots.append({page: self.read_page(page) for page in pages})
+        for page in pages:
+            self.history.setdefault(page, []).append(index)
+        vm.dirty_pages[:] = bytes(len(vm.dirty_pages))
+        return index
+
+    def restore(self, index: int):
+        if not 0 <= index < len(self.snapshots):
+            raise IndexError(f"Snapshot {index} inexistente (total: {len(self.snapshots)})")
+        vm = self.vm
+
+        # Só voltam as páginas alteradas depois do snapshot pedido
+        pages = set(self.dirty_pages())
+        for delta in self.snapshots[index + 1:]:
+            pages.update(delta)
+        for page in pages:
+            versions = self.history[page]
+            version = versions[bisect_right(versions, index) - 1]
+            start = page << DIRTY_PAGE_SHIFT
+            data = self.snapshots[version][page]
+            vm.view[start:start + len(data)] = data
+            if vm.jit is not None:
+                vm.jit.invalidate(start, DIRTY_PAGE_SIZE)
+
+        # Snapshots posteriores deixam de fazer sentido após voltar no tempo
+        for delta in self.snapshots[index + 1:]:
+            for page in delta:
+                self.history[page].pop()
+        del self.snapshots[index + 1:]
+        vm.dirty_pages[:] = bytes(len(vm.dirty_pages))
+
+    def save(self, path: str):
+        with gzip.open(path, 'wb') as fs:
+            fs.write(SNAPSHOT_MAGIC)
+            fs.write(struct.pack('>III', DIRTY_PAGE_SHIFT, len(self.vm.memory), len(self.snapshots)))
+            for delta in self.snapshots:
+                pages = sorted(delta)
+                fs.write(struct.pack('>I', len(pages)))
+                fs.write(np.array(pages, dtype='>u4').tobytes())
+                for page in pages:
+                    fs.write(delta[page])
+
+    @classmethod
+    def load(cls, path: str, vm) -> 'SnapshotChain':
+        with gzip.open(path, 'rb') as fs:
+            if fs.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} não é um arquivo de snapshots BytePusher")
+            page_shift, memory_size, count = struct.unpack('>III', fs.read(12))
+            if page_shift != DIRTY_PAGE_SHIFT or memory_size != len(vm.memory):
+                raise ValueError(f"{path}: snapshots incompatíveis com a memória desta VM")
+
+            chain = cls(vm)
+            for index in range(count):
+                (length,) = struct.unpack('>I', fs.read(4))
+                pages = np.frombuffer(fs.read(4 * length), dtype='>u4').tolist()
+                delta = {}
+                for page in pages:
+                    delta[page] = fs.read(min(DIRTY_PAGE_SIZE, memory_size - (page << DIRTY_PAGE_SHIFT)))
+                    chain.history.setdefault(page, []).append(index)
+                chain.snapshots.append(delta)
+
+        # Reconstrói a memória no estado do último snapshot
+        vm.dirty_pages[:] = b'\x01' * len(vm.dirty_pages)
+        chain.restore(count - 1)
+        return chain
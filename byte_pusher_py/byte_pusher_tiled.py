@@ -0,0 +1,172 @@
+import math
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+from byte_pusher_py.byte_pusher_farm import SharedRomImages, create_job_vm
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, load_key_script
+from byte_pusher_py.byte_pusher_palette import PAGE_SIZE, PALETTE, as_page
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+
+PAGE_SIDE = 256
+
+def tile_view(mosaic: np.ndarray, slot: int, columns: int) -> np.ndarray:
+    # Região 256x256 do mosaico [y, x] reservada à instância de índice slot
+    row, column = divmod(slot, columns)
+    return mosaic[row * PAGE_SIDE:(row + 1) * PAGE_SIDE, column * PAGE_SIDE:(column + 1) * PAGE_SIDE]
+
+def store_page(tile: np.ndarray, page: np.ndarray):
+    if len(page) != PAGE_SIZE:
+        # O bloco é uma visão não contígua do mosaico: a página é completada antes da cópia
+        page = as_page(page, np.empty(PAGE_SIZE, dtype=np.uint8))
+    np.copyto(tile, page.reshape(PAGE_SIDE, PAGE_SIDE))
+
+def step_tiles(tiles: list, frames: int):
+    for _ in range(frames):
+        for vm, tile in tiles:
+            store_page(tile, vm.emulate_frame())
+
+def create_local_vm(job: dict, engine: str) -> BytePusherVM:
+    key_script = load_key_script(job['keys']) if job.get('keys') else None
+    vm = BytePusherVM(BytePusherHeadlessDriver(key_script), engine=engine)
+    vm.load(job['rom'])
+    return vm
+
+def tile_worker(connection, mosaic_name: str, shape: tuple, columns: int, slots: list, engine: str):
+    # Processo com algumas instâncias: cada quadro é escrito direto no mosaico compartilhado
+    block = shared_memory.SharedMemory(name=mosaic_name)
+    try:
+        mosaic = np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+        tiles = [(create_job_vm(job, rom_handle, engine), tile_view(mosaic, slot, columns))
+                 for slot, job, rom_handle in slots]
+        connection.send(None)
+        while (frames := connection.recv()) is not None:
+            step_tiles(tiles, frames)
+            connection.send(None)
+    except BaseException as error:
+        connection.send(error)
+    finally:
+        # As visões precisam ser liberadas antes de fechar o bloco compartilhado
+        mosaic = tiles = None
+        block.close()
+        connection.close()
+
+class TiledRunner:
+    def __init__(self, jobs: list[dict], workers: int = 0, engine: str = 'auto', columns: int | None = None):
+        if not jobs:
+            raise ValueError("Nenhuma instância para exibir")
+        self.count = len(jobs)
+        self.columns = min(columns or math.ceil(math.sqrt(self.count)), self.count)
+        self.rows = math.ceil(self.count / self.columns)
+        shape = (self.rows * PAGE_SIDE, self.columns * PAGE_SIDE)
+        # Buffer RGB no layout [x, y] do surfarray, preenchido por uma única consulta à paleta
+        self.rgbuffer = np.zeros((shape[1], shape[0], 3), dtype=np.uint8)
+        self.frames = 0
+        self.tiles = []
+        self.connections = []
+        self.processes = []
+        self.images = None
+        self.block = None
+        if workers:
+            self.start_workers(jobs, shape, min(workers, self.count), engine)
+        else:
+            self.mosaic = np.zeros(shape, dtype=np.uint8)
+            for slot, job in enumerate(jobs):
+                self.tiles.append((create_local_vm(job, engine), tile_view(self.mosaic, slot, self.columns)))
+
+    def start_workers(self, jobs: list[dict], shape: tuple, workers: int, engine: str):
+        self.block = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1])
+        self.mosaic = np.ndarray(shape, dtype=np.uint8, buffer=self.block.buf)
+        self.mosaic.fill(0)
+        try:
+            self.images = SharedRomImages(job['rom'] for job in jobs)
+            # Instâncias distribuídas em rodízio entre os processos
+            for worker in range(workers):
+                slots = [(slot, job, self.images.handle(job['rom']))
+                         for slot, job in enumerate(jobs) if slot % workers == worker]
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=tile_worker, name=f'bytepusher-tile-{worker}', daemon=True,
+                                                  args=(child, self.block.name, shape, self.columns, slots, engine))
+                process.start()
+                child.close()
+                self.connections.append(parent)
+                self.processes.append(process)
+            self.wait_workers()
+        except BaseException:
+            self.close()
+            raise
+
+    def wait_workers(self):
+        for connection in self.connections:
+            error = connection.recv()
+            if error is not None:
+                raise error
+
+    def step(self, frames: int = 1):
+        if self.connections:
+            # Todos os processos avançam em paralelo; o mosaico fica pronto quando todos respondem
+            for connection in self.connections:
+                connection.send(frames)
+            self.wait_workers()
+        else:
+            step_tiles(self.tiles, frames)
+        self.frames += frames
+
+    def render(self) -> np.ndarray:
+        # Uma consulta à paleta para todas as instâncias; a transposição gera o layout [x, y]
+        np.take(PALETTE, self.mosaic.T, axis=0, out=self.rgbuffer)
+        return self.rgbuffer
+
+    def close(self):
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except OSError:
+                pass
+        for process in self.processes:
+            process.join()
+        for connection in self.connections:
+            connection.close()
+        self.connections = []
+        self.processes = []
+        self.tiles = []
+        if self.images is not None:
+            self.images.close()
+            self.images = None
+        if self.block is not None:
+            self.mosaic = None
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def write_rgb_ppm(path: str, rgb: np.ndarray):
+    # Buffer [x, y, 3] do surfarray gravado como PPM binário (P6) em linhas [y, x]
+    width, height = rgb.shape[:2]
+    with open(path, 'wb') as fs:
+        fs.write(f"P6 {width} {height} 255\n".encode())
+        fs.write(rgb.transpose(1, 0, 2).tobytes())
+
+def run_tiled_viewer(runner: TiledRunner, frames: int | None = None, rate: int = 60):
+    # Importado aqui para que o modo sem janela não inicialize o pygame
+    import pygame
+
+    pygame.display.init()
+    try:
+        screen = pygame.display.set_mode(runner.rgbuffer.shape[:2])
+        pygame.display.set_caption(f"BytePusherPython - {runner.count} instâncias")
+        clock = pygame.time.Clock()
+        while frames is None or runner.frames < frames:
+            if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                break
+            runner.step()
+            pygame.surfarray.blit_array(screen, runner.render())
+            pygame.display.flip()
+            clock.tick(rate)
+    finally:
+        pygame.display.quit()
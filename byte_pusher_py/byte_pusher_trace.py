@@ -0,0 +1,88 @@
+import numpy as np
+
+from byte_pusher_py.byte_pusher_memory import MEMORY_SIZE
+
+# Espaço de endereços exibido como um quadrado de 4096x4096 (uma linha = 4 KiB)
+HEATMAP_SIDE = 4096
+# Bancos de 64 KiB agrupam os PCs no relatório em pilhas
+BANK_SHIFT = 16
+
+def heat_colors(levels: np.ndarray) -> np.ndarray:
+    # Escala preto -> vermelho -> amarelo -> branco para níveis de 0 a 255
+    levels = levels.astype(np.int32) * 3
+    rgb = np.empty(levels.shape + (3,), dtype=np.uint8)
+    rgb[..., 0] = np.minimum(levels, 255)
+    rgb[..., 1] = np.clip(levels - 255, 0, 255)
+    rgb[..., 2] = np.clip(levels - 510, 0, 255)
+    return rgb
+
+class ExecutionTracer:
+    def __init__(self, sample_every: int = 1, memory_size: int = MEMORY_SIZE):
+        if sample_every < 1:
+            raise ValueError(f"Amostragem deve ser de pelo menos 1 quadro, recebido {sample_every}")
+        self.sample_every = sample_every
+        # Contadores pré-alocados: execuções por PC e escritas por endereço
+        self.pc_counts = np.zeros(memory_size, dtype=np.uint32)
+        self.write_counts = np.zeros(memory_size, dtype=np.uint32)
+        # Registros do quadro atual, preenchidos pelo laço do interpretador
+        self.pcs = [0] * 0x10000
+        self.targets = [0] * 0x10000
+        self.frames = 0
+        self.traced_frames = 0
+
+    def sample(self) -> bool:
+        # Decide se o quadro atual é registrado (um a cada sample_every)
+        frame = self.frames
+        self.frames += 1
+        if frame % self.sample_every:
+            return False
+        self.traced_frames += 1
+        return True
+
+    def record(self, executed: int, limit: int):
+        pcs = np.array(self.pcs[:executed], dtype=np.int64)
+        targets = np.array(self.targets[:executed], dtype=np.int64)
+        np.add.at(self.pc_counts, pcs, 1)
+        # Escritas fora do limite são ignoradas pelo interpretador
+        np.add.at(self.write_counts, targets[targets < limit], 1)
+
+    def top(self, count: int = 10) -> list[tuple[int, int]]:
+        hot = np.flatnonzero(self.pc_counts)
+        # Mais executados primeiro; empates pelo menor endereço
+        hot = hot[np.argsort(-self.pc_counts[hot].astype(np.int64), kind='stable')[:count]]
+        return [(int(pc), int(self.pc_counts[pc])) for pc in hot]
+
+    def export_folded(self, path: str):
+        # Formato "pilha;quadro contagem" do flamegraph.pl: banco de 64 KiB -> PC
+        with open(path, 'w', encoding='utf-8') as fs:
+            for pc in np.flatnonzero(self.pc_counts):
+                fs.write(f"bank_{pc >> BANK_SHIFT:02x};pc_{pc:06x} {self.pc_counts[pc]}\n")
+
+    def heatmap(self, counts: np.ndarray, size: int = 1024) -> np.ndarray:
+        if HEATMAP_SIDE % size:
+            raise ValueError(f"O lado da imagem deve dividir {HEATMAP_SIDE}, recebido {size}")
+        block = HEATMAP_SIDE // size
+        band = HEATMAP_SIDE * block
+        rows = len(counts) // band
+        grid = np.zeros((size, size), dtype=np.uint64)
+        # Cada pixel soma um bloco de block x block endereços, direto sobre os contadores (sem cópia)
+        grid[:rows] = counts[:rows * band].reshape(rows, block, size, block).sum(axis=(1, 3), dtype=np.uint64)
+        if rows < size:
+            # Só a última faixa, incompleta no fim da memória, é completada com zeros
+            tail = np.zeros(band, dtype=np.uint64)
+            tail[:len(counts) - rows * band] = counts[rows * band:]
+            grid[rows] = tail.reshape(block, size, block).sum(axis=(0, 2))
+        # Escala logarítmica: poucas instruções quentes não apagam o resto
+        levels = np.log1p(grid.astype(np.float64))
+        if levels.max() > 0:
+            levels *= 255 / levels.max()
+        return heat_colors(levels.astype(np.uint8))
+
+    def export_heatmap(self, path: str, kind: str = 'pc', size: int = 1024):
+        counts = {'pc': self.pc_counts, 'write': self.write_counts}.get(kind)
+        if counts is None:
+            raise ValueError(f"Mapa desconhecido: {kind!r} (disponíveis: pc, write)")
+        # PPM binário (P6), como os quadros do modo sem janela
+        with open(path, 'wb') as fs:
+            fs.write(f"P6 {size} {size} 255\n".encode())
+            fs.write(self.heatmap(counts, size).tobytes())
@@ -1,32 +1,135 @@
 import numpy as np
 
-from byte_pusher_py.byte_pusher_iodriver import BytePusherIODriver
+from byte_pusher_py.byte_pusher_driver import BytePusherDriver
+from byte_pusher_py.byte_pusher_jit import PAGE_SHIFT, BytePusherJIT
+from byte_pusher_py.byte_pusher_native import NO_DIRTY_PAGES, load_native_kernel, native_available
+from byte_pusher_py.byte_pusher_memory import DIRTY_PAGE_SHIFT, as_array, create_memory, dirty_page_count
+from byte_pusher_py.byte_pusher_rom import RomCache, check_rom_size, read_rom_into
+from byte_pusher_py.byte_pusher_snapshot import SnapshotChain
+
+# Motores do ByteByteJump: 'auto' escolhe o nativo (Numba) quando disponível;
+# 'verify' roda o nativo e o interpretador lado a lado e compara a memória
+ENGINES = ('auto', 'python', 'jit', 'native', 'verify')
 
 class BytePusherVM:
-    def __init__(self, iodriver: BytePusherIODriver):
-        self.memory = np.zeros(0xFFFFFF, dtype=np.uint8)
+    def __init__(self, iodriver: BytePusherDriver, jit: bool = False, memory_backend: str = 'bytearray',
+                 engine: str = 'auto'):
+        if jit:
+            engine = 'jit'
+        if engine not in ENGINES:
+            raise ValueError(f"Motor desconhecido: {engine!r} (disponíveis: {', '.join(ENGINES)})")
+        if engine == 'auto':
+            # Numba ausente ou quebrado: volta para o interpretador Python
+            engine = 'native' if native_available() else 'python'
+        elif engine in ('native', 'verify'):
+            try:
+                load_native_kernel()
+            except ImportError as error:
+                raise ValueError(f"O motor {engine!r} exige o Numba instalado ({error})")
+        self.engine = engine
+        # Páginas escritas desde o último snapshot (None: rastreamento desligado)
+        self.dirty_pages = None
+        self.snapshots = None
+        # FrameProfiler opcional que recebe o tempo de cada etapa de run()
+        self.profiler = None
+        # ExecutionTracer opcional: contagem por PC e mapa de escritas
+        self.tracer = None
+        self.memory = create_memory(memory_backend)
         self.iodriver = iodriver
+        # Motor opcional que traduz sequências lineares de instruções em blocos compilados
+        self.jit = BytePusherJIT(self) if engine == 'jit' else None
+    
+    def load(self, rom: str, cache: RomCache | None = None, use_mmap: bool = False, strict: bool = False):
+        if cache is not None:
+            # ROM já decodificada: custa uma única cópia para a memória
+            return self.load_image(cache.get(rom), strict)
+        
+        length = read_rom_into(rom, self.view, strict, use_mmap)
+        self.mark_dirty(0, length)
+        
+        if self.jit is not None:
+            self.jit.reset()
+        return self.array[:length]
     
-    def load(self, rom: str):
-        pc = 0
-        with open(rom, 'rb') as fs:
-            while byte := fs.read(1):
-                self.memory[pc] = byte[0]
-                pc += 1
+    def load_image(self, image, strict: bool = False):
+        # Copia uma imagem de ROM já em memória (bytes, memoryview, memória compartilhada)
+        check_rom_size('<imagem>', len(image), len(self.memory), strict)
+        length = min(len(image), len(self.memory))
+        self.view[:length] = image[:length]
+        self.mark_dirty(0, length)
         
-        return self.memory[:pc]
+        if self.jit is not None:
+            self.jit.reset()
+        return self.array[:length]
+    
+    @property
+    def memory(self):
+        return self._memory
+    
+    @memory.setter
+    def memory(self, memory):
+        # Mantém as visões (memoryview e NumPy) sincronizadas com o buffer atual, sem cópias
+        self._memory = memory
+        self.view = memoryview(memory)
+        self.array = as_array(memory)
+        if self.dirty_pages is not None:
+            # Buffer novo: todas as páginas passam a ser consideradas alteradas
+            self.dirty_pages = bytearray(b'\x01' * dirty_page_count(len(memory)))
+    
+    def enable_write_tracking(self):
+        if self.dirty_pages is not None:
+            return
+        self.dirty_pages = bytearray(dirty_page_count(len(self.memory)))
+        if self.jit is not None:
+            # Os blocos precisam ser recompilados com a marcação de páginas
+            self.jit.reset()
+    
+    def mark_dirty(self, start: int, length: int):
+        if self.dirty_pages is None or length <= 0:
+            return
+        first = start >> DIRTY_PAGE_SHIFT
+        last = (start + length - 1) >> DIRTY_PAGE_SHIFT
+        self.dirty_pages[first:last + 1] = b'\x01' * (last - first + 1)
+    
+    def snapshot(self) -> int:
+        # O primeiro snapshot liga o rastreamento de escritas e guarda a memória inteira
+        if self.snapshots is None:
+            self.snapshots = SnapshotChain(self)
+        return self.snapshots.take()
+    
+    def restore_snapshot(self, index: int):
+        if self.snapshots is None:
+            raise IndexError("Nenhum snapshot foi registrado")
+        self.snapshots.restore(index)
+    
+    def save_snapshots(self, path: str):
+        if self.snapshots is None:
+            raise ValueError("Nenhum snapshot foi registrado")
+        self.snapshots.save(path)
+    
+    def load_snapshots(self, path: str):
+        self.snapshots = SnapshotChain.load(path, self)
     
     def run(self):
+        self.iodriver.render_display_frame(self.emulate_frame())
+    
+    def emulate_frame(self):
+        # Executa um quadro sem apresentá-lo; devolve a página de vídeo (visão da memória)
+        profiler = self.profiler
         self.update_pressed_keys()
+        if profiler is not None:
+            profiler.mark('update_pressed_keys')
         self.process_byte_byte_jump()
-        self.iodriver.render_display_frame(self.copy(self.get_address(5, 1) << 16, 256 * 256))
+        if profiler is not None:
+            profiler.mark('process_byte_byte_jump')
+        # Banco de 256 amostras de 8 bits com sinal, entregue como visão da memória
+        self.iodriver.play_audio_frame(self.copy(self.get_address(6, 2) << 8, 256).view(np.int8))
+        if profiler is not None:
+            profiler.mark('play_audio_frame')
+        return self.copy(self.get_address(5, 1) << 16, 256 * 256)
     
     def get_address(self, pc: int, length: int) -> int:
-        address = 0
-        for _ in range(length):
-            address = (address << 8) + int(self.memory[pc])
-            pc += 1
-        return address
+        return int.from_bytes(self.view[pc:pc + length], 'big')
     
     def copy(self, start, length):
         # Ajustar o comprimento para não ultrapassar os limites
@@ -34,23 +137,109 @@ class BytePusherVM:
             return np.array([], dtype=np.uint8)  # Retorna vazio se o start estiver fora do range
         if start + length > len(self.memory):
             length = len(self.memory) - start  # Ajusta o length para não ultrapassar
-        return self.memory[start:start + length].copy()
-
+        # Visão sem cópia: o renderizador lê direto da memória da VM
+        return self.array[start:start + length]
     
     def update_pressed_keys(self):
-        keys_pressed = self.iodriver.get_key_pressed()
-        self.memory[0] = (keys_pressed & 0xFF00) >> 8
-        self.memory[1] = keys_pressed & 0xFF
+        # Uma única escrita dos dois bytes (big-endian) da palavra de teclas
+        self.view[0:2] = (self.iodriver.get_key_pressed() & 0xFFFF).to_bytes(2, 'big')
+        self.mark_dirty(0, 2)
+        if self.jit is not None:
+            self.jit.invalidate(0, 2)
     
     def process_byte_byte_jump(self):
         instruction_counter = 0x10000 # 65536
         pc = self.get_address(2, 3)
+        if self.tracer is not None and self.tracer.sample():
+            # Quadros registrados rodam no interpretador, qualquer que seja o motor
+            self.process_traced_byte_byte_jump(pc, instruction_counter)
+            return
+        if self.jit is not None:
+            self.jit.execute(pc, instruction_counter)
+            return
+        if self.engine == 'verify':
+            self.process_verified_byte_byte_jump(pc, instruction_counter)
+            return
+        if self.engine == 'native':
+            pc, instruction_counter = self.process_native_byte_byte_jump(pc, instruction_counter)
+        self.interpret_byte_byte_jump(pc, instruction_counter)
+    
+    def interpret_byte_byte_jump(self, pc: int, instruction_counter: int):
+        if self.dirty_pages is not None:
+            self.process_tracked_byte_byte_jump(pc, instruction_counter)
+            return
+        # Variáveis locais evitam buscas de atributo no laço quente; indexar a
+        # memoryview devolve int nativo em qualquer backend
+        view = self.view
+        limit = len(view) - 1
         while instruction_counter != 0:
-            source_index = self.get_address(pc, 3)
-            target_index = self.get_address(pc + 3, 3)
+            source_index = (view[pc] << 16) | (view[pc + 1] << 8) | view[pc + 2]
+            target_index = (view[pc + 3] << 16) | (view[pc + 4] << 8) | view[pc + 5]
             # Impedir acesso no último índice
-            if target_index >= 0 and target_index < len(self.memory) - 1:
-                self.memory[target_index] = self.memory[source_index]
-            pc = self.get_address(pc + 6, 3)
+            if target_index < limit:
+                view[target_index] = view[source_index]
+            pc = (view[pc + 6] << 16) | (view[pc + 7] << 8) | view[pc + 8]
+            instruction_counter-=1
+    
+    def process_tracked_byte_byte_jump(self, pc: int, instruction_counter: int):
+        # Mesmo laço, marcando a página de cada escrita para os snapshots
+        view = self.view
+        dirty = self.dirty_pages
+        limit = len(view) - 1
+        while instruction_counter != 0:
+            source_index = (view[pc] << 16) | (view[pc + 1] << 8) | view[pc + 2]
+            target_index = (view[pc + 3] << 16) | (view[pc + 4] << 8) | view[pc + 5]
+            if target_index < limit:
+                view[target_index] = view[source_index]
+                dirty[target_index >> DIRTY_PAGE_SHIFT] = 1
+            pc = (view[pc + 6] << 16) | (view[pc + 7] << 8) | view[pc + 8]
             instruction_counter-=1
-                
\ No newline at end of file
+    
+    def process_traced_byte_byte_jump(self, pc: int, instruction_counter: int):
+        view = self.view
+        dirty = self.dirty_pages
+        jit = self.jit
+        code_pages = jit.code_pages if jit is not None else None
+        tracer = self.tracer
+        pcs = tracer.pcs
+        targets = tracer.targets
+        limit = len(view) - 1
+        executed = 0
+        try:
+            while executed != instruction_counter:
+                source_index = (view[pc] << 16) | (view[pc + 1] << 8) | view[pc + 2]
+                target_index = (view[pc + 3] << 16) | (view[pc + 4] << 8) | view[pc + 5]
+                pcs[executed] = pc
+                targets[executed] = target_index
+                executed += 1
+                if target_index < limit:
+                    view[target_index] = view[source_index]
+                    if dirty is not None:
+                        dirty[target_index >> DIRTY_PAGE_SHIFT] = 1
+                    # Escrita sobre código compilado: o bloco do JIT deixa de valer
+                    if code_pages is not None and code_pages[target_index >> PAGE_SHIFT]:
+                        jit.invalidate(target_index)
+                pc = (view[pc + 6] << 16) | (view[pc + 7] << 8) | view[pc + 8]
+        finally:
+            tracer.record(executed, limit)
+    
+    def process_native_byte_byte_jump(self, pc: int, instruction_counter: int):
+        # Devolve o pc e as instruções restantes (não zero só em acessos fora da memória)
+        dirty = self.dirty_pages
+        dirty_array = NO_DIRTY_PAGES if dirty is None else np.frombuffer(dirty, dtype=np.uint8)
+        pc, instruction_counter = load_native_kernel()(self.array, pc, instruction_counter, dirty_array, dirty is not None)
+        return int(pc), int(instruction_counter)
+    
+    def process_verified_byte_byte_jump(self, pc: int, instruction_counter: int):
+        # Modo de teste: o interpretador Python roda sobre uma cópia da memória
+        reference = BytePusherVM(self.iodriver, engine='python')
+        reference.memory = bytearray(self.view)
+        reference.process_byte_byte_jump()
+        
+        pc, instruction_counter = self.process_native_byte_byte_jump(pc, instruction_counter)
+        self.interpret_byte_byte_jump(pc, instruction_counter)
+        
+        if reference.view != self.view:
+            differences = np.flatnonzero(reference.array != self.array)
+            raise RuntimeError(f"Motor nativo diverge do interpretador em {len(differences)} bytes "
+                               f"(primeiro endereço: {int(differences[0]):#08x})")
@@ -2,11 +2,10 @@ import os
 import logging
 from datetime import datetime
 
-def configure_logging():
+def configure_logging(log_dir: str = 'logs'):
     # Criação do manipulador de log rotativo com base na data
     date = datetime.now().strftime("%d-%m-%Y")
     file_name = f"{date}_logs.log"
-    log_dir = 'logs'  # Diretório para os arquivos de log
     full_file_path = os.path.join(log_dir, file_name)
     
     # Cria o diretório se não existir
@@ -0,0 +1,73 @@
+import wave
+import logging
+import numpy as np
+import pygame
+
+from byte_pusher_py.byte_pusher_audio import SAMPLE_RATE, AudioRingBuffer, PygameAudioSink, WavAudioSink
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+def test_ring_buffer():
+    logging.info('Iniciando teste do buffer circular de áudio...')
+    ring = AudioRingBuffer(capacity=8)
+    out = np.zeros(4, dtype=np.int8)
+
+    assert ring.write(np.array([1, 2, 3, 4, 5, 6], dtype=np.int8))
+    assert ring.read(out) == 4 and list(out) == [1, 2, 3, 4]
+
+    # A escrita atravessa o fim do buffer
+    assert ring.write(np.array([7, 8, 9, 10], dtype=np.int8))
+    assert ring.read(out) == 4 and list(out) == [5, 6, 7, 8]
+    logging.info('Leitura e escrita com volta ao início corretas')
+
+    # Escrita maior que o espaço livre é descartada e contada
+    assert not ring.write(np.arange(8, dtype=np.int8))
+    assert ring.overruns == 1, f"Erro: overruns = {ring.overruns}"
+
+    # Leitura sem dados suficientes completa com silêncio e é contada
+    assert ring.read(out) == 2 and list(out) == [9, 10, 0, 0]
+    assert ring.underruns == 1, f"Erro: underruns = {ring.underruns}"
+    logging.info('Contadores de overrun e underrun corretos\n')
+
+def test_wav_audio_sink(tmp_path):
+    logging.info('Iniciando teste da gravação de áudio em WAV...')
+    wav_path = str(tmp_path / 'audio.wav')
+    driver = BytePusherHeadlessDriver(audio=WavAudioSink(wav_path))
+    vm = BytePusherVM(driver)
+
+    # Banco de som no endereço 0x0200 << 8 = 0x020000, com uma rampa de -128 a 127
+    vm.memory[6:8] = bytes([0x02, 0x00])
+    vm.memory[0x20000:0x20100] = np.arange(-128, 128, dtype=np.int8).tobytes()
+    vm.memory[2:5] = bytes([0x00, 0x01, 0x00])
+    vm.memory[0x106:0x109] = bytes([0x00, 0x01, 0x00])  # laço em 0x100
+    for _ in range(2):
+        vm.run()
+    driver.close()
+
+    with wave.open(wav_path, 'rb') as wav:
+        assert wav.getframerate() == SAMPLE_RATE
+        assert wav.getnframes() == 2 * 256, f"Erro: {wav.getnframes()} amostras gravadas"
+        data = np.frombuffer(wav.readframes(256), dtype=np.uint8)
+    # Amostras com sinal convertidas para o formato sem sinal do WAV
+    assert np.array_equal(data, np.arange(256, dtype=np.uint8)), "Erro: Amostras convertidas incorretamente"
+    logging.info('Áudio gravado em WAV corretamente\n')
+
+def test_pygame_sink_resamples(monkeypatch):
+    logging.info('Iniciando teste de reamostragem para um mixer já aberto...')
+    monkeypatch.setenv('SDL_AUDIODRIVER', 'dummy')
+    # Mixer aberto por outro código em 44,1 kHz, 16 bits estéreo
+    pygame.mixer.init(frequency=44100, size=-16, channels=2)
+    try:
+        sink = PygameAudioSink()
+        chunk = np.arange(-128, 128, dtype=np.int8).repeat(2)
+        converted = sink.convert(chunk)
+        assert len(converted) == len(chunk) * 44100 // SAMPLE_RATE * 2, f"Erro: {len(converted)} amostras"
+        # Vizinho mais próximo: o início e o fim do bloco são preservados
+        assert converted[0] == -128 << 8 and converted[-1] == 127 << 8
+        sink.close()
+    finally:
+        pygame.mixer.quit()
+    logging.info('Bloco reamostrado para a taxa do mixer\n')
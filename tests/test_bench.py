@@ -0,0 +1,34 @@
+import logging
+
+from byte_pusher_py.byte_pusher_bench import WORKLOADS, bench_engines, compare_results, generate_rom
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, hash_page
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+def test_generated_roms():
+    logging.info('Iniciando teste das ROMs sintéticas...')
+    for workload in WORKLOADS:
+        rom = generate_rom(workload)
+        assert rom == generate_rom(workload), f"Erro: ROM {workload} não é determinística"
+
+        # Todos os motores devem produzir a mesma memória em cada carga
+        hashes = []
+        for engine in bench_engines():
+            vm = BytePusherVM(BytePusherHeadlessDriver(), engine=engine)
+            vm.load_image(rom)
+            vm.process_byte_byte_jump()
+            hashes.append(hash_page(vm.view))
+        assert len(set(hashes)) == 1, f"Erro: Motores divergem na carga {workload}"
+        logging.info(f'Carga {workload}: {len(rom)} bytes, motores idênticos')
+    logging.info('ROMs sintéticas válidas\n')
+
+def test_compare_results():
+    logging.info('Iniciando teste da comparação com a referência...')
+    baseline = {'results': {'a': 1.0, 'b': 1.0}}
+    results = {'results': {'a': 1.05, 'b': 1.2, 'c': 5.0}}
+    regressions = compare_results(results, baseline, threshold=0.10)
+    logging.info(f'Regressões: {regressions}')
+    assert len(regressions) == 1 and regressions[0].startswith('b:'), "Erro: Apenas 'b' deveria regredir"
+    logging.info('Comparação com a referência correta\n')
@@ -0,0 +1,138 @@
+import sys
+import zlib
+import struct
+import logging
+
+import numpy as np
+
+from byte_pusher_py.byte_pusher_bench import generate_rom
+from byte_pusher_py.byte_pusher_export import (COLOR_INDEX, ApngWriter, ExportDriver, FrameExporter, GifWriter,
+                                               PipeWriter)
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, run_headless
+from byte_pusher_py.byte_pusher_palette import PALETTE
+from byte_pusher_py.log_config import configure_test_logging
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+
+configure_test_logging()
+
+def random_pages(count):
+    return np.random.default_rng(0).integers(0, 256, (count, 256 * 256), dtype=np.uint8)
+
+def read_sub_blocks(data, offset):
+    chunks = []
+    while data[offset]:
+        chunks.append(data[offset + 1:offset + 1 + data[offset]])
+        offset += 1 + data[offset]
+    return b''.join(chunks), offset + 1
+
+def lzw_decode(data, min_code_size):
+    # Decodificador LZW genérico do GIF, independente do codificador testado
+    clear, end = 1 << min_code_size, (1 << min_code_size) + 1
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder='little')
+    position, size, table, previous, output = 0, min_code_size + 1, None, None, bytearray()
+    while True:
+        code = int(bits[position:position + size] @ (1 << np.arange(size)))
+        position += size
+        if code == clear:
+            table = [bytes([i]) for i in range(clear)] + [b'', b'']
+            size, previous = min_code_size + 1, None
+            continue
+        if code == end:
+            return bytes(output)
+        entry = table[code] if code < len(table) else table[previous] + table[previous][:1]
+        output += entry
+        if previous is not None:
+            table.append(table[previous] + entry[:1])
+            if len(table) == 1 << size and size < 12:
+                size += 1
+        previous = code
+
+def decode_gif(data):
+    assert data[:6] == b'GIF89a' and data[-1] == 0x3B
+    palette = np.frombuffer(data[13:13 + 768], dtype=np.uint8).reshape(256, 3)
+    offset, frames, delays = 13 + 768, [], []
+    while data[offset] != 0x3B:
+        if data[offset] == 0x21:
+            if data[offset + 1] == 0xF9:
+                delays.append(struct.unpack('<H', data[offset + 4:offset + 6])[0])
+            _, offset = read_sub_blocks(data, offset + 2)
+        else:
+            assert data[offset] == 0x2C
+            min_code_size = data[offset + 10]
+            stream, offset = read_sub_blocks(data, offset + 11)
+            frames.append(lzw_decode(stream, min_code_size))
+    return palette, frames, delays
+
+def decode_apng(data):
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    offset, chunks = 8, []
+    while offset < len(data):
+        length, kind = struct.unpack('>I4s', data[offset:offset + 8])
+        body = data[offset + 8:offset + 8 + length]
+        assert struct.unpack('>I', data[offset + 8 + length:offset + 12 + length])[0] == zlib.crc32(kind + body)
+        chunks.append((kind, body))
+        offset += 12 + length
+    frames = []
+    for kind, body in chunks:
+        if kind in (b'IDAT', b'fdAT'):
+            rows = np.frombuffer(zlib.decompress(body if kind == b'IDAT' else body[4:]), dtype=np.uint8).reshape(256, 257)
+            assert not rows[:, 0].any(), "Erro: Filtro de linha inesperado"
+            frames.append(rows[:, 1:].reshape(-1))
+    return dict(chunks), frames
+
+def test_gif_writer(tmp_path):
+    logging.info('Iniciando teste do exportador GIF...')
+    pages = random_pages(6)
+    exporter = FrameExporter(GifWriter(str(tmp_path / 'out.gif')), batch=4)
+    for page in pages:
+        exporter.add_frame(page)
+    exporter.close()
+
+    palette, frames, delays = decode_gif((tmp_path / 'out.gif').read_bytes())
+    assert np.array_equal(palette, PALETTE)
+    # 60 quadros/s viram 50 quadros/s de 2 centésimos: um em cada seis é descartado
+    assert delays == [2] * 5
+    for frame, page in zip(frames, pages[[0, 2, 3, 4, 5]]):
+        assert frame == page.tobytes(), "Erro: Quadro GIF decodificado diverge da página"
+    logging.info('GIF decodificado idêntico às páginas\n')
+
+def test_apng_writer(tmp_path):
+    logging.info('Iniciando teste do exportador APNG...')
+    pages = random_pages(5)
+    exporter = FrameExporter(ApngWriter(str(tmp_path / 'out.png')), batch=2)
+    for page in pages:
+        exporter.add_frame(page)
+    exporter.close()
+
+    chunks, frames = decode_apng((tmp_path / 'out.png').read_bytes())
+    assert struct.unpack('>II', chunks[b'acTL']) == (5, 0), "Erro: Número de quadros não foi atualizado"
+    assert len(chunks[b'PLTE']) == 216 * 3
+    assert len(frames) == 5
+    for frame, page in zip(frames, pages):
+        assert np.array_equal(frame, COLOR_INDEX[page]), "Erro: Quadro APNG diverge da página"
+    logging.info('APNG decodificado idêntico às páginas\n')
+
+def test_pipe_writer_from_vm(tmp_path):
+    logging.info('Iniciando teste da exportação por processo codificador...')
+    output = tmp_path / 'frames.rgb'
+    command = [sys.executable, '-c', f"import shutil, sys; shutil.copyfileobj(sys.stdin.buffer, open({str(output)!r}, 'wb'))"]
+    exporter = FrameExporter(PipeWriter(command), batch=2)
+    driver = BytePusherHeadlessDriver()
+    vm = BytePusherVM(ExportDriver(driver, exporter), engine='python')
+    # Camadas configuradas no exportador chegam ao driver envolvido
+    overlays = [object()]
+    vm.iodriver.overlays = overlays
+    assert driver.overlays is overlays, "Erro: Camadas não repassadas ao driver envolvido"
+    vm.load_image(generate_rom('display'))
+    run_headless(vm, 3)
+    vm.iodriver.close()
+
+    reference = BytePusherVM(BytePusherHeadlessDriver(), engine='python')
+    reference.load_image(generate_rom('display'))
+    pages = [np.array(reference.emulate_frame()) for _ in range(3)]
+
+    frames = np.frombuffer(output.read_bytes(), dtype=np.uint8).reshape(3, 256 * 256, 3)
+    assert exporter.frames == 3
+    for frame, page in zip(frames, pages):
+        assert np.array_equal(frame, PALETTE[page]), "Erro: Quadro RGB enviado ao codificador diverge"
+    logging.info('Quadros RGB crus entregues ao codificador\n')
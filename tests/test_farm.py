@@ -0,0 +1,39 @@
+import json
+import logging
+
+from byte_pusher_py.byte_pusher_farm import load_manifest, run_farm
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, hash_page, load_key_script
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+from tests.test_headless import write_key_echo_rom
+
+configure_test_logging()
+
+def test_run_farm(tmp_path):
+    logging.info('Iniciando teste da execução em vários processos...')
+    write_key_echo_rom(tmp_path / 'echo.bp')
+    (tmp_path / 'keys.txt').write_text('0 7\n', encoding='utf-8')
+    manifest = [
+        {'rom': 'echo.bp', 'frames': 2},
+        {'rom': 'echo.bp', 'keys': 'keys.txt', 'frames': 2},
+    ]
+    (tmp_path / 'manifest.json').write_text(json.dumps(manifest), encoding='utf-8')
+
+    jobs = load_manifest(str(tmp_path / 'manifest.json'))
+    report = run_farm(jobs, workers=2)
+    assert report['total_frames'] == 4
+    assert len(report['jobs']) == 2
+
+    # Cada resultado deve coincidir com uma execução local da mesma tarefa
+    for job, result in zip(jobs, report['jobs']):
+        key_script = load_key_script(job['keys']) if job['keys'] else None
+        driver = BytePusherHeadlessDriver(key_script, hash_frames=True)
+        vm = BytePusherVM(driver)
+        vm.load(job['rom'])
+        for _ in range(job['frames']):
+            vm.run()
+        assert result['frame_hashes'] == driver.frame_hashes, f"Erro: Hashes de quadro divergem em {job}"
+        assert result['memory_hash'] == hash_page(vm.view), f"Erro: Hash da memória diverge em {job}"
+
+    assert report['jobs'][0]['memory_hash'] != report['jobs'][1]['memory_hash'], "Erro: Entradas diferentes deveriam gerar memórias diferentes"
+    logging.info('Resultados dos processos coincidem com a execução local\n')
@@ -0,0 +1,66 @@
+import os
+import logging
+
+from byte_pusher_py.byte_pusher_cli import main
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, load_key_script, write_ppm
+from byte_pusher_py.byte_pusher_palette import PALETTE
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+def write_key_echo_rom(path):
+    # ROM mínima: copia o byte baixo das teclas para o primeiro pixel da tela (página 0x01)
+    rom = bytearray(0x109)
+    rom[2:5] = [0x00, 0x01, 0x00]  # pc inicial = 0x100
+    rom[5] = 0x01                  # página de vídeo = 0x010000
+    rom[0x100:0x109] = [0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00]
+    with open(path, 'wb') as fs:
+        fs.write(rom)
+
+def test_load_key_script(tmp_path):
+    logging.info('Iniciando teste de leitura do script de teclas...')
+    script_path = tmp_path / 'keys.txt'
+    script_path.write_text('# quadro teclas\n0 0\n2 0x0402  # K_1 + K_a\n5 3\n', encoding='utf-8')
+
+    script = load_key_script(str(script_path))
+    assert script == {0: 0, 2: 0x0402, 5: 3}, f"Erro: Script lido incorretamente: {script}"
+
+    driver = BytePusherHeadlessDriver(script)
+    keys = []
+    for _ in range(6):
+        keys.append(driver.get_key_pressed())
+        driver.render_display_frame(bytes(256 * 256))
+    assert keys == [0, 0, 0x0402, 0x0402, 0x0402, 3], f"Erro: Sequência de teclas incorreta: {keys}"
+    logging.info('Script de teclas aplicado quadro a quadro corretamente\n')
+
+def test_cli_run_headless(tmp_path):
+    logging.info('Iniciando teste do modo sem janela pela linha de comando...')
+    rom_path = tmp_path / 'echo.bp'
+    write_key_echo_rom(rom_path)
+    script_path = tmp_path / 'keys.txt'
+    script_path.write_text('1 5\n', encoding='utf-8')
+    output_dir = tmp_path / 'frames'
+
+    result = main(['run', str(rom_path), '--frames', '2', '--keys', str(script_path), '--output-dir', str(output_dir)])
+    assert result == 0
+
+    frames = sorted(os.listdir(output_dir))
+    assert frames == ['frame_000000.ppm', 'frame_000001.ppm'], f"Erro: Quadros gravados: {frames}"
+
+    with open(output_dir / 'frame_000001.ppm', 'rb') as fs:
+        data = fs.read()
+    header = b"P6 256 256 255\n"
+    assert data.startswith(header)
+    assert list(data[len(header):len(header) + 3]) == list(PALETTE[5]), "Erro: Pixel não reflete a tecla do script"
+    logging.info('ROM executada sem janela e quadros gravados corretamente\n')
+
+def test_write_short_page(tmp_path):
+    logging.info('Iniciando teste de PPM de página incompleta...')
+    path = tmp_path / 'short.ppm'
+    # Página 0xFF: só 65535 bytes antes do fim da memória
+    write_ppm(str(path), bytes([5]) * (256 * 256 - 1))
+    data = path.read_bytes()
+    header = b"P6 256 256 255\n"
+    assert len(data) == len(header) + 256 * 256 * 3, "Erro: PPM truncado para página incompleta"
+    assert list(data[-6:]) == list(PALETTE[5]) + [0, 0, 0], "Erro: Último pixel deveria ficar preto"
+    logging.info('Página incompleta gravada com o restante preto\n')
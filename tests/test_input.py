@@ -0,0 +1,72 @@
+import logging
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver
+from byte_pusher_py.byte_pusher_input import CombinedInput, GamepadInput, KeyboardInput, ScriptedInput, load_keymap
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+def key_event(kind, key):
+    return pygame.event.Event(kind, key=key)
+
+def test_keyboard_remap(tmp_path):
+    logging.info('Iniciando teste do remapeamento de teclas...')
+    keymap_path = tmp_path / 'keys.txt'
+    keymap_path.write_text("up 2  # seta para cima\nleft 4\nspace 0xF\n", encoding='utf-8')
+    keyboard = KeyboardInput(load_keymap(str(keymap_path)))
+
+    keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_UP))
+    keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_SPACE))
+    # Teclas fora do mapa (inclusive as do padrão) são ignoradas
+    assert not keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_0))
+    assert keyboard.get_key_pressed() == (1 << 2) | (1 << 15)
+
+    keyboard.remap('w', 2)
+    assert keyboard.get_key_pressed() == 0, "Erro: Remapear deveria soltar todas as teclas"
+    keyboard.handle_event(key_event(pygame.KEYDOWN, pygame.K_w))
+    assert keyboard.get_key_pressed() == 1 << 2
+
+    # Perder o foco solta tudo: os KEYUP não chegariam
+    keyboard.handle_event(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+    assert keyboard.get_key_pressed() == 0
+
+    with pytest.raises(ValueError):
+        KeyboardInput({'up': 16})
+    with pytest.raises(ValueError):
+        KeyboardInput({'tecla inexistente': 1})
+    logging.info('Remapeamento de teclas correto\n')
+
+@patch('pygame.joystick.Joystick')
+@patch('pygame.joystick.get_count', return_value=1)
+def test_gamepad_and_combined(mock_get_count, mock_joystick):
+    logging.info('Iniciando teste do controle combinado ao teclado...')
+    mock_joystick.return_value.get_instance_id.return_value = 7
+    gamepad = GamepadInput(buttons={0: 10, 1: 11})
+    keyboard = KeyboardInput()
+    combined = CombinedInput([keyboard, gamepad])
+
+    combined.handle_event(pygame.event.Event(pygame.JOYBUTTONDOWN, instance_id=7, button=1))
+    # Eventos de outro controle não afetam este
+    combined.handle_event(pygame.event.Event(pygame.JOYBUTTONDOWN, instance_id=8, button=0))
+    combined.handle_event(key_event(pygame.KEYDOWN, pygame.K_3))
+    assert combined.get_key_pressed() == (1 << 11) | (1 << 3)
+
+    combined.handle_event(pygame.event.Event(pygame.JOYBUTTONUP, instance_id=7, button=1))
+    assert combined.get_key_pressed() == 1 << 3
+    logging.info('Controle e teclado combinados corretamente\n')
+
+def test_scripted_input_drives_vm():
+    logging.info('Iniciando teste da entrada por roteiro...')
+    script = ScriptedInput({0: 0x1234, 2: 0xABCD})
+    assert [script.get_key_pressed() for _ in range(4)] == [0x1234, 0x1234, 0xABCD, 0xABCD]
+
+    # O driver sem janela usa a mesma interface: uma escrita de dois bytes por quadro
+    vm = BytePusherVM(BytePusherHeadlessDriver({0: 0xBEEF}), engine='python')
+    vm.update_pressed_keys()
+    assert bytes(vm.view[0:2]) == b'\xbe\xef'
+    logging.info('Entrada por roteiro correta\n')
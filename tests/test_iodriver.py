@@ -1,44 +1,45 @@
 import pygame
 import logging
+import numpy as np
 from unittest.mock import MagicMock, patch
 
-from byte_pusher_py.byte_pusher_iodriver import BytePusherIODriver
+from byte_pusher_py.byte_pusher_iodriver import BytePusherIndexedIODriver, BytePusherIODriver
+from byte_pusher_py.byte_pusher_palette import PALETTE
 from byte_pusher_py.log_config import configure_test_logging
 
 configure_test_logging()
 
 class TestBytePusherIODriver:
 
-    @patch('pygame.key.get_pressed')
-    def test_get_key_press(self, mock_get_pressed):
+    def test_get_key_press(self):
         logging.info('Iniciando teste: test_get_key_press...')
-        logging.info('Simulando as teclas pressionadas: "K_1(2)" e "K_2(4)"')
-        mock_get_pressed.return_value = [False] * 256  # Cria uma lista de 256 False
-        mock_get_pressed.return_value[pygame.K_1] = True  # Simula K_1 pressionada
-        mock_get_pressed.return_value[pygame.K_2] = True  # Simula K_2 pressionada
-
-        driver = BytePusherIODriver()
+        logging.info('Simulando os eventos de teclado: "K_1(2)" e "K_2(4)"')
+        driver = BytePusherIODriver(MagicMock())
+        for key in (pygame.K_1, pygame.K_2, pygame.K_z):
+            driver.input.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key))
         key_press = driver.get_key_pressed()
 
         logging.info('Valor esperado é: K_1(2) + K_2(4) -> "6"')
-        expected_value = 2 + 4  # K_1 (2) + K_2 (4)
+        expected_value = 2 + 4  # K_1 (2) + K_2 (4); K_z não está mapeada
         if key_press != expected_value:
             logging.error(f"Esperado {expected_value}, mas retornou {key_press}\n")
         assert key_press == expected_value
         logging.info(f"Esperado {expected_value}, retornou {key_press}")
+
+        # Soltar K_1 limpa apenas o seu bit
+        driver.input.handle_event(pygame.event.Event(pygame.KEYUP, key=pygame.K_1))
+        assert driver.get_key_pressed() == 4
         
         logging.info('Teste finalizado com sucesso: test_get_key_press\n')
         
-    @patch('pygame.Surface')
-    def test_render_display_frame(self, mock_surface):
+    @patch('pygame.display.flip')
+    @patch('pygame.surfarray.blit_array')
+    def test_render_display_frame(self, mock_blit_array, mock_flip):
         logging.info('Iniciando teste: test_render_display_frame...')
-        
-        # Mocka uma instância de Surface
-        mock_surface_instance = MagicMock()
-        mock_surface.return_value = mock_surface_instance
 
-        # Instancia a classe
-        driver = BytePusherIODriver()
+        # Instancia a classe com uma tela simulada
+        mock_screen = MagicMock()
+        driver = BytePusherIODriver(mock_screen)
 
         # Cria um conjunto de dados para teste (256x256 = 65536 bytes)
         test_data = bytearray([i % 256 for i in range(65536)])
@@ -48,24 +49,87 @@ class TestBytePusherIODriver:
         driver.render_display_frame(test_data)
         logging.info('Método render_display_frame executado')
 
-        # Verifica se a textura foi criada corretamente
-        mock_surface.assert_called_once_with((256, 256))
-        logging.info('A textura de 256x256 foi criada corretamente')
-
-        # Contar quantos pixels devem ser pretos (valores acima de 215)
-        black_pixels = sum(1 for c in test_data if c > 215)
-        colored_pixels = 65536 - black_pixels  # Restante dos pixels que têm cor
-        logging.info(f'Pixels pretos: {black_pixels} | Pixels coloridos: {colored_pixels}')
+        # Verifica se o buffer foi enviado para a tela uma única vez
+        mock_blit_array.assert_called_once_with(mock_screen, driver.rgbuffer)
+        mock_flip.assert_called_once()
+        logging.info('O buffer RGB foi enviado para a tela')
 
-        # Verifica se o método set_at foi chamado o número correto de vezes
-        if mock_surface_instance.set_at.call_count != 65536:
-            logging.error(f"Esperado 65536 chamadas ao método set_at, mas retornou {mock_surface_instance.set_at.call_count}\n")
-        assert mock_surface_instance.set_at.call_count == 65536
-        logging.info(f'O método set_at foi chamado 65536 vezes conforme esperado')
+        # Compara com o mapeamento de cores original, pixel a pixel
+        for i, c in enumerate(test_data):
+            if c < 216:
+                expected = [(c // 36) % 6 * 51, (c // 6) % 6 * 51, c % 6 * 51]
+            else:
+                expected = [0, 0, 0]  # Valores de 216 a 255 são pretos
+            x, y = i % 256, i // 256
+            if list(driver.rgbuffer[x, y]) != expected:
+                logging.error(f"Pixel ({x}, {y}) com cor {c}: esperado {expected}, obtido {list(driver.rgbuffer[x, y])}\n")
+            assert list(driver.rgbuffer[x, y]) == expected
+        logging.info('Todos os pixels correspondem ao mapeamento de cores esperado')
 
-        # Testa se os pixels pretos foram configurados corretamente
-        expected_black = pygame.Color(0, 0, 0)
-        mock_surface_instance.set_at.assert_any_call((0, 0), expected_black)
-        logging.info(f'Pixels pretos foram configurados corretamente')
+        # Uma página incompleta deve deixar o restante da tela preto
+        driver.render_display_frame(test_data[:100])
+        assert not driver.rgbuffer[:, 1:].any(), "Erro: Pixels fora da página incompleta não estão pretos"
+        logging.info('Página incompleta renderizada com o restante preto')
 
         logging.info('Teste finalizado com sucesso: test_render_display_frame\n')
+
+    @patch('pygame.display.update')
+    @patch('pygame.display.flip')
+    @patch('pygame.surfarray.blit_array')
+    def test_render_dirty_regions(self, mock_blit_array, mock_flip, mock_update):
+        logging.info('Iniciando teste: test_render_dirty_regions...')
+        mock_screen = MagicMock()
+        driver = BytePusherIODriver(mock_screen)
+
+        # O primeiro quadro é sempre completo
+        frame = np.zeros(65536, dtype=np.uint8)
+        driver.render_display_frame(frame)
+        assert mock_flip.call_count == 1 and mock_update.call_count == 0
+        logging.info('Primeiro quadro redesenhado por completo')
+
+        # Um único pixel alterado (x=20, y=40) atualiza apenas o bloco 16x16 que o contém
+        frame[40 * 256 + 20] = 5
+        driver.render_display_frame(frame)
+        mock_update.assert_called_once_with([pygame.Rect(16, 32, 16, 16)])
+        mock_screen.subsurface.assert_called_once_with(pygame.Rect(16, 32, 16, 16))
+        assert list(driver.rgbuffer[20, 40]) == [0, 0, 5 * 51], "Erro: Pixel alterado não foi convertido"
+        logging.info('Somente o bloco alterado foi convertido e enviado para a tela')
+
+        # Quadro idêntico: nada é enviado para a tela
+        driver.render_display_frame(frame)
+        assert mock_update.call_count == 1 and mock_flip.call_count == 1
+
+        # Mais da metade dos blocos alterada: volta ao redesenho completo
+        frame[:] = 7
+        driver.render_display_frame(frame)
+        assert mock_flip.call_count == 2, "Erro: Quadro muito alterado deveria ser redesenhado por completo"
+        assert (driver.rgbuffer == PALETTE[7]).all()
+        logging.info('Teste finalizado com sucesso: test_render_dirty_regions\n')
+
+    def test_render_indexed_scaled(self, monkeypatch):
+        logging.info('Iniciando teste: test_render_indexed_scaled...')
+        monkeypatch.setenv('SDL_VIDEODRIVER', 'dummy')
+        pygame.display.init()
+        try:
+            screen = pygame.display.set_mode((512, 512))
+            driver = BytePusherIndexedIODriver(screen, scale=2)
+
+            test_data = np.arange(65536, dtype=np.uint32).astype(np.uint8)
+            driver.render_display_frame(test_data)
+
+            # Cada pixel da página vira um bloco 2x2 com a cor da paleta
+            pixels = pygame.surfarray.array3d(screen)
+            expected = np.take(PALETTE, test_data.reshape(256, 256).T, axis=0)
+            assert np.array_equal(pixels[::2, ::2], expected), "Erro: Pixels ampliados com cor incorreta"
+            assert np.array_equal(pixels[1::2, 1::2], expected), "Erro: Ampliação não é inteira"
+            logging.info('Página ampliada 2x com as cores da paleta')
+
+            try:
+                BytePusherIndexedIODriver(screen, scale=9)
+            except ValueError:
+                logging.info('Escala fora do intervalo rejeitada')
+            else:
+                raise AssertionError("Erro: Escala 9 deveria ser rejeitada")
+        finally:
+            pygame.display.quit()
+        logging.info('Teste finalizado com sucesso: test_render_indexed_scaled\n')
@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock
+import numpy as np
+import logging
+
+from byte_pusher_py.byte_pusher_bench import INSTRUCTION_COUNT, generate_rom
+from byte_pusher_py.byte_pusher_iodriver import BytePusherIODriver
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+def write_instruction(memory, pc, source, target, jump):
+    memory[pc:pc + 9] = list(source.to_bytes(3, 'big') + target.to_bytes(3, 'big') + jump.to_bytes(3, 'big'))
+
+def build_vms(program):
+    vms = []
+    for jit in (False, True):
+        vm = BytePusherVM(iodriver=MagicMock(spec=BytePusherIODriver), jit=jit)
+        program(vm.memory)
+        vms.append(vm)
+    return vms
+
+def test_jit_straight_line():
+    logging.info('Iniciando teste do JIT com código linear...')
+
+    def program(memory):
+        memory[2:5] = [0x00, 0x01, 0x00]  # pc inicial = 0x100
+        pc = 0x100
+        for i in range(40):
+            # Cada instrução copia um byte de dados para a área de saída
+            memory[0x2000 + i] = (i * 7) & 0xFF
+            jump = pc + 9 if i < 39 else 0x100
+            write_instruction(memory, pc, 0x2000 + i, 0x3000 + ((i * 3) % 64), jump)
+            pc += 9
+
+    interpreter, jit = build_vms(program)
+    interpreter.process_byte_byte_jump()
+    jit.process_byte_byte_jump()
+
+    assert len(jit.jit.blocks) > 0, "Erro: Nenhum bloco foi compilado"
+    assert np.array_equal(interpreter.memory, jit.memory), "Erro: Memória do JIT diverge do interpretador"
+    logging.info('Memória do JIT idêntica à do interpretador\n')
+
+def test_jit_self_modifying_code():
+    logging.info('Iniciando teste do JIT com código auto-modificável...')
+
+    def program(memory):
+        memory[2:5] = [0x00, 0x01, 0x00]  # pc inicial = 0x100
+        # Contador que a própria ROM incrementa reescrevendo o operando de origem
+        for i in range(256):
+            memory[0x4000 + i] = (i + 1) & 0xFF
+        write_instruction(memory, 0x100, 0x4000, 0x5000, 0x109)
+        # Copia o byte de 0x5000 para o byte baixo do operando de origem da primeira instrução
+        write_instruction(memory, 0x109, 0x5000, 0x102, 0x112)
+        # Escreve no próprio operando de salto: termina o bloco no meio
+        write_instruction(memory, 0x112, 0x4001, 0x119, 0x11B)
+        write_instruction(memory, 0x11B, 0x5000, 0x6000, 0x100)
+
+    interpreter, jit = build_vms(program)
+    for _ in range(2):
+        interpreter.process_byte_byte_jump()
+        jit.process_byte_byte_jump()
+
+    assert np.array_equal(interpreter.memory, jit.memory), "Erro: Memória do JIT diverge do interpretador"
+    logging.info('Memória do JIT idêntica à do interpretador com código auto-modificável\n')
+
+def test_jit_invalidate():
+    logging.info('Iniciando teste de invalidação de blocos...')
+    vm = BytePusherVM(iodriver=MagicMock(spec=BytePusherIODriver), jit=True)
+    write_instruction(vm.memory, 0x100, 0x2000, 0x3000, 0x109)
+    write_instruction(vm.memory, 0x109, 0x2000, 0x3000, 0x100)
+    vm.jit.execute(0x100, 2)
+    assert 0x100 in vm.jit.blocks, "Erro: Bloco não foi compilado"
+
+    vm.jit.invalidate(0x10A)
+    assert 0x100 not in vm.jit.blocks, "Erro: Bloco não foi invalidado após escrita no código"
+    assert not vm.jit.code_pages[0x1], "Erro: Página de código continua marcada"
+    logging.info('Bloco invalidado corretamente\n')
+
+def test_jit_rewritten_pages_are_interpreted():
+    logging.info('Iniciando teste do JIT com páginas reescritas a todo quadro...')
+    rom = generate_rom('self_modifying')
+    vms = []
+    for jit in (False, True):
+        vm = BytePusherVM(iodriver=MagicMock(spec=BytePusherIODriver), jit=jit)
+        vm.load_image(rom)
+        for _ in range(3):
+            vm.process_byte_byte_jump()
+        vms.append(vm)
+    interpreter, jit = vms
+
+    assert np.array_equal(interpreter.memory, jit.memory), "Erro: Memória do JIT diverge do interpretador"
+    # Cada instrução reescreve a seguinte: nenhuma página deve ficar sendo recompilada
+    assert not jit.jit.blocks, "Erro: Blocos compilados em código que se reescreve"
+    assert sum(jit.jit.recompilations.values()) < INSTRUCTION_COUNT, "Erro: Recompilações demais"
+    logging.info('Páginas reescritas passaram ao interpretador local\n')
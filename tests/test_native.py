@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+import logging
+import sys
+
+import numpy as np
+import pytest
+
+from byte_pusher_py.byte_pusher_bench import WORKLOADS, generate_rom
+from byte_pusher_py.byte_pusher_iodriver import BytePusherIODriver
+from byte_pusher_py import byte_pusher_native
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+requires_numba = pytest.mark.skipif(not byte_pusher_native.native_available(), reason="Numba não instalado")
+
+def build_vm(engine, rom):
+    vm = BytePusherVM(iodriver=MagicMock(spec=BytePusherIODriver), engine=engine)
+    vm.load_image(rom)
+    return vm
+
+@requires_numba
+def test_native_matches_interpreter():
+    logging.info('Iniciando teste do motor nativo contra o interpretador...')
+    for workload in WORKLOADS:
+        rom = generate_rom(workload)
+        interpreter, native = build_vm('python', rom), build_vm('native', rom)
+        interpreter.enable_write_tracking()
+        native.enable_write_tracking()
+        for _ in range(2):
+            interpreter.process_byte_byte_jump()
+            native.process_byte_byte_jump()
+        assert np.array_equal(interpreter.array, native.array), f"Erro: Memória diverge na carga {workload}"
+        assert interpreter.dirty_pages == native.dirty_pages, f"Erro: Páginas sujas divergem na carga {workload}"
+        logging.info(f'Carga {workload}: motor nativo idêntico ao interpretador')
+    logging.info('Motor nativo validado\n')
+
+@requires_numba
+def test_native_out_of_range():
+    logging.info('Iniciando teste de acesso fora da memória no motor nativo...')
+    # Salto para o fim da memória: o restante cai no interpretador e gera o mesmo erro
+    rom = bytes([0, 0, 0xFF, 0xFF, 0xFA]) + bytes(16)
+    for engine in ('python', 'native'):
+        vm = build_vm(engine, rom)
+        with pytest.raises(IndexError):
+            vm.process_byte_byte_jump()
+    logging.info('Acesso fora da memória tratado igual ao interpretador\n')
+
+@requires_numba
+def test_verify_engine():
+    logging.info('Iniciando teste do modo de verificação...')
+    vm = build_vm('verify', generate_rom('self_modifying'))
+    vm.process_byte_byte_jump()
+
+    # Kernel adulterado: o modo de verificação deve acusar a divergência
+    def broken_kernel(pc, instruction_counter):
+        vm.array[0x123456] ^= 0xFF
+        return 0, 0
+    vm.process_native_byte_byte_jump = broken_kernel
+    with pytest.raises(RuntimeError, match='0x123456'):
+        vm.process_byte_byte_jump()
+    logging.info('Divergência detectada pelo modo de verificação\n')
+
+def test_broken_numba_falls_back(monkeypatch):
+    logging.info('Iniciando teste do Numba instalado mas quebrado...')
+    # Numba encontrado pelo find_spec, mas a importação falha (ex.: NumPy incompatível)
+    monkeypatch.setattr(byte_pusher_native, 'NATIVE_AVAILABLE', True)
+    monkeypatch.setattr(byte_pusher_native, 'native_byte_byte_jump', None)
+    monkeypatch.setitem(sys.modules, 'numba', None)
+
+    vm = build_vm('auto', generate_rom('straight'))
+    assert vm.engine == 'python', "Erro: 'auto' deveria voltar para o interpretador"
+    vm.process_byte_byte_jump()
+    for engine in ('native', 'verify'):
+        with pytest.raises(ValueError):
+            build_vm(engine, b'')
+    logging.info('Motor automático usa o interpretador quando o Numba não importa\n')
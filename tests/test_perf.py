@@ -0,0 +1,60 @@
+import csv
+import json
+import logging
+from unittest.mock import MagicMock
+
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, run_headless
+from byte_pusher_py.byte_pusher_perf import SECTIONS, FrameProfiler, PerfOverlay, TextOverlay
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+def test_frame_profiler(tmp_path):
+    logging.info('Iniciando teste da instrumentação por quadro...')
+    vm = BytePusherVM(BytePusherHeadlessDriver(hash_frames=True), jit=True)
+    vm.profiler = FrameProfiler(window=4, keep_history=True)
+    vm.iodriver.profiler = vm.profiler
+    run_headless(vm, 6)
+
+    stats = vm.profiler.stats()
+    logging.info(f"Quadro p50: {stats['frame']['p50'] * 1000:.3f} ms")
+    assert vm.profiler.frames == 6
+    assert stats['process_byte_byte_jump']['p50'] > 0, "Erro: Tempo do interpretador não foi medido"
+    assert stats['process_byte_byte_jump']['p99'] >= stats['process_byte_byte_jump']['p50']
+    assert stats['render_display_frame']['p50'] > 0, "Erro: Tempo do driver sem janela não foi medido"
+
+    csv_path = str(tmp_path / 'perf.csv')
+    vm.profiler.export(csv_path)
+    with open(csv_path, newline='', encoding='utf-8') as fs:
+        rows = list(csv.reader(fs))
+    assert rows[0] == ['frame', *SECTIONS]
+    assert len(rows) == 7, "Erro: O histórico completo deveria ser exportado"
+
+    json_path = str(tmp_path / 'perf.json')
+    vm.profiler.export(json_path)
+    with open(json_path, encoding='utf-8') as fs:
+        report = json.load(fs)
+    assert report['frames'] == 6 and len(report['samples']) == 6
+    logging.info('Instrumentação e exportação corretas\n')
+
+def test_overlay_caches_text():
+    logging.info('Iniciando teste do cache de texto da camada de desempenho...')
+    font = MagicMock()
+    overlay = TextOverlay(font)
+    for _ in range(5):
+        overlay.set_lines(['FPS: 60'])
+    assert font.render.call_count == 1, "Erro: O texto não deveria ser renderizado de novo"
+
+    screen = MagicMock()
+    overlay.draw(screen)
+    assert screen.blit.call_count == 1
+
+    profiler = FrameProfiler(window=8)
+    perf_overlay = PerfOverlay(font, profiler, refresh_every=30)
+    perf_overlay.update(60.0)
+    lines = perf_overlay.lines
+    profiler.frames = 1
+    perf_overlay.update(59.0)
+    assert perf_overlay.lines == lines, "Erro: A camada só deveria atualizar a cada N quadros"
+    logging.info('Camada de desempenho usa superfícies em cache\n')
@@ -0,0 +1,71 @@
+import time
+import logging
+
+from byte_pusher_py.byte_pusher_bench import generate_rom
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver
+from byte_pusher_py.byte_pusher_pipeline import FramePacer, PipelinedRunner
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+def test_frame_pacer_corrects_drift():
+    logging.info('Iniciando teste do cadenciador de quadros...')
+    clock = FakeClock()
+    pacer = FramePacer(rate=50, clock=clock, sleep=clock.sleep)
+
+    pacer.wait()
+    assert abs(clock.now - 0.02) < 1e-9
+
+    # Um quadro lento (30 ms) é compensado no seguinte, sem acumular atraso
+    clock.now += 0.03
+    pacer.wait()
+    assert len(clock.sleeps) == 1, "Erro: Quadro atrasado não deveria esperar"
+    clock.now += 0.005
+    pacer.wait()
+    assert abs(clock.now - 0.06) < 1e-9, f"Erro: Prazo deveria ser 0.06, obtido {clock.now}"
+    logging.info(f'Esperas: {clock.sleeps}')
+
+    # Atraso muito grande: o prazo é ressincronizado em vez de disparar quadros em rajada
+    clock.now += 1.0
+    pacer.wait()
+    assert pacer.deadline == clock.now
+    logging.info('Cadenciador compensa atrasos corretamente\n')
+
+class SlowDriver(BytePusherHeadlessDriver):
+    def render_display_frame(self, data):
+        time.sleep(0.05)
+        super().render_display_frame(data)
+
+def test_pipelined_runner_skips_frames():
+    logging.info('Iniciando teste do modo em pipeline...')
+    vm = BytePusherVM(SlowDriver(hash_frames=True), jit=True)
+    vm.load_image(generate_rom('straight'))
+    runner = PipelinedRunner(vm, buffers=3)
+
+    runner.start()
+    try:
+        deadline = time.perf_counter() + 1.0
+        while time.perf_counter() < deadline:
+            runner.present_latest()
+    finally:
+        runner.stop()
+
+    logging.info(f'Produzidos: {runner.produced}, apresentados: {runner.presented}, pulados: {runner.skipped}')
+    assert runner.presented > 0
+    assert runner.produced > runner.presented, "Erro: A emulação não deveria esperar pela apresentação"
+    assert runner.skipped > 0, "Erro: Quadros atrasados deveriam ser pulados"
+    assert runner.free.qsize() + runner.ready.qsize() == 3, "Erro: Buffers foram perdidos"
+    logging.info('Modo em pipeline pula quadros sem bloquear a emulação\n')
@@ -0,0 +1,55 @@
+import logging
+
+from byte_pusher_py.byte_pusher_cli import main
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver
+from byte_pusher_py.byte_pusher_replay import InputRecorder, read_hash_log, read_input_log
+from byte_pusher_py.log_config import configure_test_logging
+from tests.test_headless import write_key_echo_rom
+
+configure_test_logging()
+
+def test_record_and_replay(tmp_path):
+    logging.info('Iniciando teste de gravação e reprodução de teclas...')
+    rom_path = str(tmp_path / 'echo.bp')
+    write_key_echo_rom(rom_path)
+    script_path = tmp_path / 'keys.txt'
+    script_path.write_text('0 1\n1 0x0203\n2 0\n', encoding='utf-8')
+    input_log = str(tmp_path / 'input.bpin')
+
+    assert main(['run', rom_path, '--frames', '3', '--keys', str(script_path), '--record', input_log]) == 0
+    keys = read_input_log(input_log).tolist()
+    assert keys == [1, 0x0203, 0], f"Erro: Teclas gravadas: {keys}"
+    logging.info(f'Teclas gravadas: {keys}')
+
+    # Duas reproduções (interpretador e JIT) devem gerar hashes idênticos
+    reference = str(tmp_path / 'reference.bphash')
+    candidate = str(tmp_path / 'candidate.bphash')
+    assert main(['replay', rom_path, input_log, '--hashes', reference]) == 0
+    assert main(['replay', rom_path, input_log, '--hashes', candidate, '--verify', reference, '--jit']) == 0
+
+    hashes = read_hash_log(reference)
+    assert len(hashes) == 3 and len(set(hashes)) == 3, "Erro: Cada quadro deveria ter um hash distinto"
+    logging.info('Reprodução verificada quadro a quadro')
+
+    # Uma referência diferente deve ser detectada
+    script_path.write_text('0 1\n1 0x0204\n', encoding='utf-8')
+    other_log = str(tmp_path / 'other.bpin')
+    assert main(['run', rom_path, '--frames', '3', '--keys', str(script_path), '--record', other_log]) == 0
+    assert main(['replay', rom_path, other_log, '--hashes', candidate, '--verify', reference]) == 1
+    logging.info('Divergência detectada corretamente\n')
+
+def test_recorder_forwards_driver(tmp_path):
+    logging.info('Iniciando teste do gravador como driver completo...')
+    driver = BytePusherHeadlessDriver({0: 0x0042})
+    recorder = InputRecorder(driver, str(tmp_path / 'keys.bpin'))
+    # Instrumentação, camadas e som configurados no gravador chegam ao driver envolvido
+    profiler, overlays = object(), [object()]
+    recorder.profiler = profiler
+    recorder.overlays = overlays
+    assert driver.profiler is profiler and driver.overlays is overlays, "Erro: Atributos não repassados"
+    assert recorder.audio is None
+    recorder.present()
+    assert recorder.get_key_pressed() == 0x0042
+    recorder.close()
+    assert list(read_input_log(str(tmp_path / 'keys.bpin'))) == [0x0042]
+    logging.info('Gravador repassa instrumentação, camadas e som ao driver\n')
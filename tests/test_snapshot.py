@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+import logging
+
+from byte_pusher_py.byte_pusher_iodriver import BytePusherIODriver
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+def build_counter_vm(jit):
+    # ROM que copia o byte baixo das teclas para um endereço que muda a cada quadro
+    mock_iodriver = MagicMock(spec=BytePusherIODriver)
+    vm = BytePusherVM(iodriver=mock_iodriver, jit=jit)
+    vm.memory[2:5] = bytes([0x00, 0x01, 0x00])  # pc inicial = 0x100
+    vm.memory[0x100:0x109] = bytes([0x00, 0x00, 0x01, 0x05, 0x00, 0x00, 0x00, 0x01, 0x09])
+    # Copia as teclas para o byte baixo do destino da primeira instrução
+    vm.memory[0x109:0x112] = bytes([0x00, 0x00, 0x01, 0x00, 0x01, 0x05, 0x00, 0x01, 0x00])
+    return vm, mock_iodriver
+
+def test_snapshot_restore():
+    for jit in (False, True):
+        logging.info(f'Iniciando teste de snapshots (jit={jit})...')
+        vm, mock_iodriver = build_counter_vm(jit)
+
+        states = []
+        for frame in range(4):
+            mock_iodriver.get_key_pressed.return_value = 0x10 + frame
+            vm.update_pressed_keys()
+            vm.process_byte_byte_jump()
+            assert vm.snapshot() == frame
+            states.append(bytes(vm.memory))
+
+        # Os deltas devem conter apenas as páginas alteradas
+        delta_pages = [len(delta) for delta in vm.snapshots.snapshots[1:]]
+        logging.info(f'Páginas por delta: {delta_pages}')
+        assert all(pages <= 3 for pages in delta_pages), f"Erro: Deltas grandes demais: {delta_pages}"
+
+        # Alterações ainda não registradas também devem ser desfeitas
+        mock_iodriver.get_key_pressed.return_value = 0xFF
+        vm.update_pressed_keys()
+        vm.process_byte_byte_jump()
+
+        vm.restore_snapshot(1)
+        assert bytes(vm.memory) == states[1], "Erro: Memória não corresponde ao snapshot restaurado"
+        assert len(vm.snapshots) == 2, "Erro: Snapshots posteriores deveriam ser descartados"
+
+        # A execução continua de forma determinística após a restauração
+        mock_iodriver.get_key_pressed.return_value = 0x12
+        vm.update_pressed_keys()
+        vm.process_byte_byte_jump()
+        assert bytes(vm.memory) == states[2], "Erro: Execução após restauração diverge da original"
+        logging.info(f'Snapshot restaurado corretamente (jit={jit})\n')
+
+def test_snapshot_save_load(tmp_path):
+    logging.info('Iniciando teste de gravação e leitura de snapshots...')
+    vm, mock_iodriver = build_counter_vm(False)
+    for frame in range(3):
+        mock_iodriver.get_key_pressed.return_value = 0x20 + frame
+        vm.update_pressed_keys()
+        vm.process_byte_byte_jump()
+        vm.snapshot()
+    expected = bytes(vm.memory)
+
+    path = str(tmp_path / 'chain.bpsnap.gz')
+    vm.save_snapshots(path)
+    logging.info(f'Arquivo de snapshots com {(tmp_path / "chain.bpsnap.gz").stat().st_size} bytes')
+
+    restored, _ = build_counter_vm(False)
+    restored.load_snapshots(path)
+    assert bytes(restored.memory) == expected, "Erro: Memória reconstruída incorretamente"
+    assert len(restored.snapshots) == 3
+
+    restored.restore_snapshot(0)
+    vm.restore_snapshot(0)
+    assert bytes(restored.memory) == bytes(vm.memory), "Erro: Cadeia carregada não restaura o snapshot base"
+    logging.info('Cadeia de snapshots gravada e carregada corretamente\n')
@@ -0,0 +1,34 @@
+import os
+import sys
+import logging
+import subprocess
+
+from byte_pusher_py.byte_pusher_bench import HEAVY_MODULES, IMPORT_MODULES, measure_import
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+# Cerca de 2x o custo medido (~0,15 s, dominado pelo NumPy): detecta importações pesadas novas
+IMPORT_BUDGET = 0.3
+
+def test_core_import_is_lean():
+    logging.info('Iniciando teste do custo de importação...')
+    for module in IMPORT_MODULES:
+        seconds, heavy = measure_import(module)
+        logging.info(f'{module}: {seconds * 1000:.1f} ms, módulos pesados: {heavy}')
+        assert not heavy, f"Erro: {module} importa {', '.join(heavy)}"
+        assert seconds < IMPORT_BUDGET, f"Erro: {module} levou {seconds:.3f} s para importar"
+    logging.info(f'Nenhum módulo do núcleo carrega {", ".join(HEAVY_MODULES)}\n')
+
+def test_import_has_no_side_effects(tmp_path):
+    logging.info('Iniciando teste de efeitos colaterais da importação...')
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = ("import logging\n"
+            "import byte_pusher_py.byte_pusher_iodriver, byte_pusher_py.byte_pusher_cli\n"
+            "print(len(logging.root.handlers))")
+    env = dict(os.environ, PYTHONPATH=root, SDL_VIDEODRIVER='dummy')
+    output = subprocess.run([sys.executable, '-c', code], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, check=True).stdout.split()
+    assert output[-1] == '0', "Erro: A importação configurou o logging"
+    assert not os.listdir(tmp_path), f"Erro: A importação criou {os.listdir(tmp_path)}"
+    logging.info('Importação sem criar diretórios nem handlers de log\n')
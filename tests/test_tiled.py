@@ -0,0 +1,82 @@
+import json
+import logging
+
+import numpy as np
+
+from byte_pusher_py.byte_pusher_bench import generate_rom
+from byte_pusher_py.byte_pusher_cli import main
+from byte_pusher_py.byte_pusher_farm import load_manifest
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, load_key_script
+from byte_pusher_py.byte_pusher_palette import PALETTE
+from byte_pusher_py.byte_pusher_tiled import TiledRunner, store_page, tile_view
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+from tests.test_headless import write_key_echo_rom
+
+configure_test_logging()
+
+def write_manifest(tmp_path):
+    write_key_echo_rom(tmp_path / 'echo.bp')
+    (tmp_path / 'display.bp').write_bytes(generate_rom('display'))
+    (tmp_path / 'keys.txt').write_text('0 7\n', encoding='utf-8')
+    manifest = [
+        {'rom': 'echo.bp', 'frames': 2},
+        {'rom': 'echo.bp', 'keys': 'keys.txt', 'frames': 2},
+        {'rom': 'display.bp', 'frames': 2},
+    ]
+    path = tmp_path / 'manifest.json'
+    path.write_text(json.dumps(manifest), encoding='utf-8')
+    return str(path)
+
+def expected_page(job, frames):
+    key_script = load_key_script(job['keys']) if job['keys'] else None
+    vm = BytePusherVM(BytePusherHeadlessDriver(key_script), engine='python')
+    vm.load(job['rom'])
+    for _ in range(frames):
+        page = vm.emulate_frame()
+    return page.reshape(256, 256)
+
+def test_tiled_runner(tmp_path):
+    logging.info('Iniciando teste do mosaico de várias instâncias...')
+    jobs = load_manifest(write_manifest(tmp_path))
+    mosaics = []
+    for workers in (0, 2):
+        with TiledRunner(jobs, workers=workers, engine='python') as runner:
+            runner.step(2)
+            assert (runner.rows, runner.columns) == (2, 2)
+            mosaic = runner.mosaic.copy()
+            rgb = runner.render().copy()
+        mosaics.append(mosaic)
+        logging.info(f'{workers} processos: mosaico {mosaic.shape}')
+
+        for slot, job in enumerate(jobs):
+            row, column = divmod(slot, 2)
+            tile = mosaic[row * 256:(row + 1) * 256, column * 256:(column + 1) * 256]
+            assert np.array_equal(tile, expected_page(job, 2)), f"Erro: Instância {slot} diverge da execução isolada"
+        # Posição vazia da grade fica preta
+        assert not mosaic[256:, 256:].any()
+        # Uma única consulta à paleta para o mosaico inteiro, no layout [x, y]
+        assert np.array_equal(rgb, PALETTE[mosaic].transpose(1, 0, 2))
+
+    assert np.array_equal(mosaics[0], mosaics[1]), "Erro: Processos auxiliares divergem da execução local"
+    logging.info('Mosaico idêntico com e sem processos auxiliares\n')
+
+def test_tile_command(tmp_path):
+    logging.info('Iniciando teste do comando tile sem janela...')
+    manifest = write_manifest(tmp_path)
+    output_dir = tmp_path / 'mosaic'
+    assert main(['tile', manifest, '--headless', '-c', '3', '-o', str(output_dir), '--engine', 'python']) == 0
+    frames = sorted(output_dir.iterdir())
+    assert [frame.name for frame in frames] == ['mosaic_000000.ppm', 'mosaic_000001.ppm']
+    assert frames[0].read_bytes().startswith(b"P6 768 256 255\n")
+    logging.info('Mosaicos gravados em PPM\n')
+
+def test_store_short_page():
+    logging.info('Iniciando teste de página incompleta no mosaico...')
+    mosaic = np.full((256, 512), 9, dtype=np.uint8)
+    # Página 0xFF: só 65535 bytes antes do fim da memória
+    store_page(tile_view(mosaic, 1, 2), np.full(256 * 256 - 1, 5, dtype=np.uint8))
+    assert (mosaic[:, :256] == 9).all(), "Erro: Página escrita fora do seu bloco"
+    tile = mosaic[:, 256:].reshape(-1)
+    assert (tile[:-1] == 5).all() and tile[-1] == 0, "Erro: Página incompleta não foi completada com preto"
+    logging.info('Página incompleta gravada no bloco com o restante preto\n')
@@ -0,0 +1,66 @@
+import logging
+
+import numpy as np
+
+from byte_pusher_py.byte_pusher_bench import CODE_START, WORKLOADS, generate_rom
+from byte_pusher_py.byte_pusher_cli import main
+from byte_pusher_py.byte_pusher_headless import BytePusherHeadlessDriver, hash_page
+from byte_pusher_py.byte_pusher_trace import ExecutionTracer
+from byte_pusher_py.byte_pusher_vm import BytePusherVM
+from byte_pusher_py.log_config import configure_test_logging
+
+configure_test_logging()
+
+def test_tracer_counts():
+    logging.info('Iniciando teste do rastreador de execução...')
+    for workload in WORKLOADS:
+        rom = generate_rom(workload)
+        reference = BytePusherVM(BytePusherHeadlessDriver(), engine='python')
+        reference.load_image(rom)
+        reference.process_byte_byte_jump()
+
+        for engine in ('python', 'jit'):
+            vm = BytePusherVM(BytePusherHeadlessDriver(), engine=engine)
+            vm.load_image(rom)
+            vm.tracer = ExecutionTracer()
+            vm.process_byte_byte_jump()
+            # O rastreamento não pode alterar o resultado do quadro
+            assert hash_page(vm.view) == hash_page(reference.view), f"Erro: Memória diverge em {workload}/{engine}"
+            assert vm.tracer.pc_counts.sum() == 0x10000, "Erro: Cada instrução deve ser contada uma vez"
+            assert vm.tracer.write_counts.sum() == 0x10000, "Erro: Cada escrita deve ser contada uma vez"
+
+        if workload == 'straight':
+            # Código linear de 4096 instruções: cada PC executa 16 vezes por quadro
+            assert vm.tracer.top(1) == [(CODE_START, 16)]
+        logging.info(f'Carga {workload}: {np.count_nonzero(vm.tracer.pc_counts)} PCs distintos')
+    logging.info('Contagens do rastreador corretas\n')
+
+def test_tracer_sampling():
+    logging.info('Iniciando teste da amostragem do rastreador...')
+    vm = BytePusherVM(BytePusherHeadlessDriver(), engine='jit')
+    vm.load_image(generate_rom('self_modifying'))
+    vm.tracer = ExecutionTracer(sample_every=3)
+    for _ in range(4):
+        vm.process_byte_byte_jump()
+    assert vm.tracer.frames == 4 and vm.tracer.traced_frames == 2, "Erro: Deveriam ser registrados os quadros 0 e 3"
+    assert vm.tracer.pc_counts.sum() == 2 * 0x10000
+    logging.info('Amostragem a cada 3 quadros correta\n')
+
+def test_trace_exports(tmp_path):
+    logging.info('Iniciando teste da exportação do rastreador...')
+    rom_path = tmp_path / 'straight.bp'
+    rom_path.write_bytes(generate_rom('straight'))
+    trace_dir = tmp_path / 'trace'
+    assert main(['run', str(rom_path), '-n', '2', '--engine', 'python', '--trace', str(trace_dir)]) == 0
+
+    lines = (trace_dir / 'pcs.folded').read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 4096, "Erro: Uma linha por PC executado"
+    stack, count = lines[0].split()
+    assert stack == f'bank_01;pc_{CODE_START:06x}' and int(count) == 32
+
+    for name in ('pc_heatmap.ppm', 'write_heatmap.ppm'):
+        data = (trace_dir / name).read_bytes()
+        header = b"P6 1024 1024 255\n"
+        assert data.startswith(header) and len(data) == len(header) + 1024 * 1024 * 3
+        assert any(data[len(header):]), f"Erro: Mapa {name} vazio"
+    logging.info('Relatório em pilhas e mapas de calor exportados\n')
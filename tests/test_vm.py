@@ -4,6 +4,7 @@ import tempfile
 import logging
 
 from byte_pusher_py.byte_pusher_iodriver import BytePusherIODriver
+from byte_pusher_py.byte_pusher_rom import RomCache
 from byte_pusher_py.byte_pusher_vm import BytePusherVM
 from byte_pusher_py.log_config import configure_test_logging
 
@@ -210,4 +211,77 @@ def test_copy():
     assert np.array_equal(copied_memory, expected_memory), "Erro: Cópia da memória não deveria retornar dados!"
     logging.info('Cópia da memória quando start está fora do range está correta!')
 
-    logging.info("Teste do método copy passou com sucesso!\n")
\ No newline at end of file
+    logging.info("Teste do método copy passou com sucesso!\n")
+
+
+def test_memory_backends():
+    logging.info('Iniciando teste dos backends de memória...')
+    results = []
+    for backend in ('numpy', 'bytearray'):
+        mock_iodriver = MagicMock(spec=BytePusherIODriver)
+        vm = BytePusherVM(iodriver=mock_iodriver, memory_backend=backend)
+        logging.info(f'Backend: {backend} -> {type(vm.memory).__name__}')
+
+        vm.memory[2:5] = [0x00, 0x01, 0x00]  # pc inicial = 0x100
+        vm.memory[0x100:0x109] = [0x00, 0x20, 0x00, 0x00, 0x30, 0x00, 0x00, 0x01, 0x00]
+        vm.memory[0x2000] = 0xAB
+        vm.process_byte_byte_jump()
+
+        assert vm.get_address(0x100, 3) == 0x2000, f"Erro: Endereço decodificado incorretamente no backend {backend}"
+        assert vm.memory[0x3000] == 0xAB, f"Erro: Byte não copiado no backend {backend}"
+
+        # A visão NumPy deve compartilhar o buffer com a memória da VM
+        display = vm.copy(0x3000, 16)
+        vm.memory[0x3001] = 0xCD
+        assert display[1] == 0xCD, f"Erro: copy() não devolveu uma visão sem cópia no backend {backend}"
+        results.append(bytes(vm.array[:0x4000]))
+
+    assert results[0] == results[1], "Erro: Backends produziram memórias diferentes"
+    logging.info('Backends de memória produzem o mesmo resultado!\n')
+
+def test_load_oversize_rom():
+    logging.info('Iniciando teste de carregamento de ROM maior que a memória...')
+    with tempfile.NamedTemporaryFile(delete=False) as temp_rom:
+        temp_rom.write(bytes(range(32)))
+        temp_rom_name = temp_rom.name
+
+    for use_mmap in (False, True):
+        mock_iodriver = MagicMock(spec=BytePusherIODriver)
+        vm = BytePusherVM(iodriver=mock_iodriver)
+        vm.memory = bytearray(16)  # Memória reduzida para simular o limite de endereçamento
+
+        loaded_memory = vm.load(temp_rom_name, use_mmap=use_mmap)
+        logging.info(f'mmap={use_mmap}: {len(loaded_memory)} bytes carregados')
+        assert bytes(loaded_memory) == bytes(range(16)), "Erro: ROM não foi truncada no limite da memória"
+
+        vm.memory = bytearray(16)
+        try:
+            vm.load(temp_rom_name, use_mmap=use_mmap, strict=True)
+        except ValueError as error:
+            logging.info(f'ROM rejeitada no modo estrito: {error}')
+        else:
+            raise AssertionError("Erro: ROM maior que a memória deveria ser rejeitada no modo estrito")
+        assert bytes(vm.memory) == bytes(16), "Erro: memória foi alterada por uma ROM rejeitada no modo estrito"
+
+    logging.info("Teste de ROM maior que a memória passou com sucesso!\n")
+
+def test_load_with_cache():
+    logging.info('Iniciando teste do cache de ROMs...')
+    rom_data = bytes([0x10, 0x20, 0x30, 0x40])
+    names = []
+    for _ in range(2):
+        with tempfile.NamedTemporaryFile(delete=False) as temp_rom:
+            temp_rom.write(rom_data)
+            names.append(temp_rom.name)
+
+    cache = RomCache()
+    for name in names + names:
+        vm = BytePusherVM(iodriver=MagicMock(spec=BytePusherIODriver))
+        loaded_memory = vm.load(name, cache=cache)
+        assert bytes(loaded_memory) == rom_data, "Erro: ROM carregada do cache incorretamente"
+
+    logging.info(f'Acertos: {cache.hits}, falhas: {cache.misses}, imagens: {len(cache.images)}')
+    assert cache.misses == 2 and cache.hits == 2, "Erro: Cache não reaproveitou as leituras"
+    # Arquivos com o mesmo conteúdo compartilham a mesma imagem
+    assert len(cache.images) == 1, "Erro: Conteúdo idêntico deveria gerar uma única imagem"
+    logging.info("Teste do cache de ROMs passou com sucesso!\n")